@@ -897,10 +897,10 @@ class AdaptiveContextSystem:
         """Get comprehensive status of the adaptive context system"""
         status = {
             'current_context': None,
-            'active_rules': len([r for r in self.adaptive_rules if r.is_active]),
+            'active_rules': sum(1 for r in self.adaptive_rules if r.is_active),
             'total_rules': len(self.adaptive_rules),
             'context_history_length': len(self.context_history),
-            'recent_transitions': list(self.context_transitions)[-5:],
+            'recent_transitions': [self.context_transitions[i] for i in range(-min(5, len(self.context_transitions)), 0)],
             'training_data_loaded': len(self.trained_market_conditions) > 0,
             'pattern_success_rates_available': len(self.pattern_success_rates) > 0,
             'ia1_accuracy_patterns_available': len(self.ia1_accuracy_patterns) > 0,
@@ -1,26 +1,34 @@
 import os
+import sys
 import aiohttp
 import asyncio
 import logging
 import json
 import time
+import heapq
+import itertools
 from typing import List, Dict, Any, Optional, Tuple, Set
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import yfinance as yf
 import ccxt
 from dotenv import load_dotenv
-import hashlib
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4096)
+def _normalize_symbol(symbol: str) -> str:
+    """Cache key for a symbol: upper-cased, '-' stripped and interned (bounded memo)"""
+    return sys.intern(symbol.replace('-', '').upper())
+
 class APIStatus(Enum):
     ACTIVE = "active"
     RATE_LIMITED = "rate_limited"
@@ -43,8 +51,32 @@ class APIEndpoint:
     error_count: int = 0
     last_error_time: float = 0
     success_rate: float = 1.0
+    rate_tokens: Optional[float] = None  # Token bucket (None = plein)
+    rate_refill_time: float = 0
 
-@dataclass
+@dataclass(slots=True)
+class APIResponseStats:
+    """Running response-time aggregates for one API (O(1) update, serialized on demand)"""
+    count: int = 0
+    total_time: float = 0.0
+    min_time: float = float("inf")
+    max_time: float = 0.0
+    last_time: float = 0.0
+    
+    def record(self, response_time: float):
+        self.count += 1
+        self.total_time += response_time
+        if response_time < self.min_time:
+            self.min_time = response_time
+        if response_time > self.max_time:
+            self.max_time = response_time
+        self.last_time = response_time
+    
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+@dataclass(slots=True)
 class MarketDataResponse:
     symbol: str
     price: float
@@ -61,12 +93,28 @@ class MarketDataResponse:
 class UltraRobustMarketAggregator:
     """ULTRA-ROBUST Market Data Aggregator avec 10+ APIs fallback"""
     
+    # TTL par champ (secondes), aligné sur la cadence de mise à jour de chaque donnée
+    FIELD_TTL = {"price": 60, "price_change_24h": 300, "volume_24h": 300, "market_cap": 3600}
+    
     def __init__(self):
         self.session = None
         self.logger = logging.getLogger(__name__)
         self.api_endpoints = self._initialize_ultra_robust_apis()
-        self.cache = {}
+        self.cache: "OrderedDict[str, Tuple[MarketDataResponse, float]]" = OrderedDict()  # symbol -> (data, expires_at monotonic), ordre LRU
+        self.price_cache: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()  # symbol -> (price, expires_at), TTL prix seul
+        self.max_cache_entries = 2_000  # Au-delà, éviction LRU en O(1)
+        self._expiry_heap: List[Tuple[float, int, str, bool, float]] = []  # (deadline, seq, symbol, full_cache?, expires_at)
+        self._heap_seq = itertools.count()  # Départage les échéances égales sans comparer les symboles
         self.cache_ttl = 300  # 5 minutes
+        self.stale_ttl = 300  # Fenêtre stale-while-revalidate après expiration
+        self._background_refreshes: Dict[str, asyncio.Task] = {}
+        self._inflight: "OrderedDict[str, asyncio.Task]" = OrderedDict()  # Single-flight par symbole
+        self.max_inflight = 10_000  # Borne mémoire si l'upstream bloque longtemps
+        self.batch_concurrency = 10  # Requêtes upstream simultanées max en mode batch
+        self._fetch_sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Boucle propriétaire de l'état async ci-dessus
+        # Compteurs par cache (données complètes / prix seul), simples entiers mis à jour sur le chemin de lecture
+        self.cache_stats = {"data_hits": 0, "data_stale_hits": 0, "data_misses": 0, "price_hits": 0, "price_misses": 0}
         
     def _initialize_ultra_robust_apis(self) -> List[APIEndpoint]:
         """Initialize all premium + free APIs for maximum robustness"""
@@ -170,17 +218,250 @@ class UltraRobustMarketAggregator:
     
     async def get_ultra_robust_price_data(self, symbol: str) -> Optional[MarketDataResponse]:
         """Fetch price data with ultra-robust fallback across all APIs"""
-        
-        # Cache check first
-        cache_key = f"price_{symbol}"
-        if cache_key in self.cache:
-            cache_data, cache_time = self.cache[cache_key]
-            if time.time() - cache_time < self.cache_ttl:
-                return cache_data
-        
-        # Try each API in priority order
+        self._ensure_loop_state()
+        key = _normalize_symbol(symbol)
+        
+        # Cache check first (clé = symbole normalisé; l'appel API garde le symbole d'origine)
+        cached = self.cache.get(key)
+        if cached:
+            self.cache.move_to_end(key)
+            now = time.monotonic()
+            if self._is_fresh(key, cached, now):
+                self.cache_stats["data_hits"] += 1
+                return cached[0]
+            if cached[1] + self.stale_ttl > now:
+                # Stale-while-revalidate: serve stale data now, refresh in background
+                self.cache_stats["data_stale_hits"] += 1
+                self._schedule_background_refresh(key, symbol)
+                return cached[0]
+        
+        self.cache_stats["data_misses"] += 1
+        return await self._fetch_single_flight(key, symbol)
+    
+    def _ensure_loop_state(self):
+        """Rebind loop-bound state (futures, tasks, semaphore, session) when called from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Instance globale réutilisée par plusieurs boucles (tests, reload): les données en cache restent valides
+        previous_loop, self._loop = self._loop, loop
+        self._inflight.clear()
+        self._background_refreshes.clear()
+        self._fetch_sem = asyncio.Semaphore(self.batch_concurrency)
+        old_session, self.session = self.session, None
+        if old_session is not None and not old_session.closed:
+            if previous_loop is not None and previous_loop.is_running():
+                # Ancienne boucle encore active (autre thread): fermeture planifiée sur celle-ci
+                previous_loop.call_soon_threadsafe(lambda: asyncio.ensure_future(old_session.close()))
+            else:
+                # Boucle arrêtée ou fermée: aucun callback n'y tournera. Fermeture synchrone des transports
+                # (partie non-async de close(), aiohttp 3.x) puis détachement: rien n'attend l'ancienne boucle
+                connector = old_session.connector
+                old_session.detach()
+                if connector is not None:
+                    connector._close()
+    
+    def _schedule_background_refresh(self, key: str, symbol: str):
+        """Start one background refresh per symbol unless a fetch is already running"""
+        if key not in self._inflight and key not in self._background_refreshes:
+            task = asyncio.create_task(self._fetch_single_flight(key, symbol))
+            self._background_refreshes[key] = task
+            task.add_done_callback(lambda t: self._on_background_refresh_done(key, t))
+    
+    async def _fetch_single_flight(self, key: str, symbol: str) -> Optional[MarketDataResponse]:
+        """Single-flight: concurrent callers for the same symbol await the same upstream fetch"""
+        task = self._inflight.get(key)
+        if task is None:
+            # Tâche détachée: annuler un appelant (client déconnecté, arrêt) n'annule que son attente, pas le fetch partagé
+            task = asyncio.ensure_future(self._fetch_and_cache(key, symbol))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+            if len(self._inflight) > self.max_inflight:
+                # Le plus ancien continue jusqu'au bout, il n'est simplement plus partagé
+                self._inflight.popitem(last=False)
+        return await asyncio.shield(task)
+    
+    async def _fetch_and_cache(self, key: str, symbol: str) -> Optional[MarketDataResponse]:
+        result = await self._fetch_with_fallback(symbol)
+        if result:
+            # Cache successful result
+            now = time.monotonic()
+            self._cache_set(self.cache, key, (result, now + self._ttl_for(result)))
+            self._cache_set(self.price_cache, key, (result.price, now + self.FIELD_TTL["price"]))
+        return result
+    
+    def _on_fetch_done(self, symbol: str, task: asyncio.Task):
+        if self._inflight.get(symbol) is task:
+            del self._inflight[symbol]
+        if not task.cancelled():
+            task.exception()  # Marque l'exception comme récupérée si plus aucun appelant n'attend
+    
+    def _cache_set(self, cache: OrderedDict, symbol: str, entry: tuple):
+        """Insert or refresh an entry as most recently used, evicting the least recently used past the cap"""
+        cache[symbol] = entry
+        cache.move_to_end(symbol)
+        while len(cache) > self.max_cache_entries:
+            cache.popitem(last=False)
+        # Une entrée complète reste servable (stale) jusqu'à la fin de la fenêtre stale-while-revalidate
+        is_full = cache is self.cache
+        deadline = entry[1] + self.stale_ttl if is_full else entry[1]
+        heapq.heappush(self._expiry_heap, (deadline, next(self._heap_seq), symbol, is_full, entry[1]))
+        self._purge_expired()
+        if len(self._expiry_heap) > 4 * self.max_cache_entries:
+            self._compact_expiry_heap()
+    
+    def _purge_expired(self):
+        """Drop dead entries by popping the expiry heap head: O(k log n) for k expired, no full scan"""
+        heap = self._expiry_heap
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            _, _, symbol, is_full, expires_at = heapq.heappop(heap)
+            cache = self.cache if is_full else self.price_cache
+            entry = cache.get(symbol)
+            # Ignore les marqueurs périmés d'une entrée rafraîchie depuis
+            if entry is not None and entry[1] == expires_at:
+                del cache[symbol]
+    
+    def _compact_expiry_heap(self):
+        """Rebuild the heap from live entries once markers of refreshed/evicted entries outnumber them"""
+        # Appelé paresseusement depuis _cache_set: aucune tâche de nettoyage en arrière-plan
+        seq = self._heap_seq
+        heap = [(expires_at + self.stale_ttl, next(seq), symbol, True, expires_at) for symbol, (_, expires_at) in self.cache.items()]
+        heap.extend((expires_at, next(seq), symbol, False, expires_at) for symbol, (_, expires_at) in self.price_cache.items())
+        heapq.heapify(heap)
+        self._expiry_heap = heap
+    
+    def _ttl_for(self, data: MarketDataResponse) -> float:
+        """Cache TTL for a response, driven by the fields its source actually provided"""
+        # Une source "prix seul" (volume_24h=0 en guise de valeur absente) expire vite pour laisser une source complète prendre le relais
+        if not data.volume_24h:
+            return min(self.FIELD_TTL["price"], self.cache_ttl)
+        # price_change_24h peut valoir 0.0 légitimement: seule l'absence (None) compte
+        ttl = min(self.FIELD_TTL[f] for f in ("price_change_24h", "volume_24h", "market_cap") if getattr(data, f) is not None)
+        return min(ttl, self.cache_ttl)
+    
+    def _is_fresh(self, key: str, cached: tuple, now: float) -> bool:
+        """A full entry is fresh while its own TTL runs and its price is within FIELD_TTL["price"] (recent fetch or live tick)"""
+        if cached[1] <= now:
+            return False
+        price_entry = self.price_cache.get(key)
+        return price_entry is not None and price_entry[1] > now
+    
+    def _on_background_refresh_done(self, symbol: str, task: asyncio.Task):
+        """Release a finished background refresh and log its failure if any"""
+        self._background_refreshes.pop(symbol, None)
+        if not task.cancelled() and task.exception():
+            self.logger.warning(f"⚠️ Background refresh failed: {task.exception()}")
+    
+    def invalidate_symbol(self, symbol: str):
+        """Drop cached data for a symbol so the next read refetches it"""
+        symbol = _normalize_symbol(symbol)
+        self.cache.pop(symbol, None)
+        self.price_cache.pop(symbol, None)
+    
+    def invalidate_symbols(self, symbols: List[str]):
+        """Drop cached data for the given symbols only, leaving the rest of the cache warm"""
+        for symbol in symbols:
+            self.invalidate_symbol(symbol)
+    
+    def on_price_update(self, symbol: str, price: float):
+        """Price event from a live source: refresh the cached price instead of waiting for TTL expiry"""
+        symbol = _normalize_symbol(symbol)
+        now = time.monotonic()
+        # Le prix a sa propre entrée: un tick ne touche pas les autres champs
+        self._cache_set(self.price_cache, symbol, (price, now + self.FIELD_TTL["price"]))
+        cached = self.cache.get(symbol)
+        if cached and cached[1] > now:
+            # Même échéance: le marqueur d'expiration existant reste valable
+            self.cache[symbol] = (replace(cached[0], price=price, timestamp=datetime.now(timezone.utc)), cached[1])
+            self.cache.move_to_end(symbol)
+        # Entrée complète périmée: gardée telle quelle pour la fenêtre stale-while-revalidate
+    
+    def get_cached_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Cached prices still fresh (live ticks or recent fetches), None for the rest: one clock read, one pass"""
+        now = time.monotonic()
+        price_cache_get = self.price_cache.get
+        touch = self.price_cache.move_to_end
+        prices = {}
+        for symbol in symbols:
+            key = _normalize_symbol(symbol)
+            cached = price_cache_get(key)
+            if cached and cached[1] > now:
+                touch(key)
+                prices[symbol] = cached[0]
+            else:
+                prices[symbol] = None
+        misses = sum(1 for price in prices.values() if price is None)
+        self.cache_stats["price_hits"] += len(prices) - misses
+        self.cache_stats["price_misses"] += misses
+        return prices
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit rates and sizes of the full-data and price caches"""
+        stats = self.cache_stats
+        data_reads = stats["data_hits"] + stats["data_stale_hits"] + stats["data_misses"]
+        price_reads = stats["price_hits"] + stats["price_misses"]
+        return {
+            **stats,
+            "data_hit_rate": (stats["data_hits"] + stats["data_stale_hits"]) / data_reads if data_reads else 0,
+            "price_hit_rate": stats["price_hits"] / price_reads if price_reads else 0,
+            "data_entries": len(self.cache),
+            "price_entries": len(self.price_cache),
+            "inflight": len(self._inflight)
+        }
+    
+    async def get_ultra_robust_batch_price_data(self, symbols: List[str]) -> Dict[str, Optional[MarketDataResponse]]:
+        """Fetch price data for several symbols, serving cache hits first and deduplicating symbols.
+        Results are keyed by the symbols as given by the caller."""
+        self._ensure_loop_state()
+        # Normalisation une seule fois à l'entrée; déduplication par clé, fetch avec le premier symbole d'origine
+        keys = {symbol: _normalize_symbol(symbol) for symbol in symbols}
+        originals: Dict[str, str] = {}
+        for symbol, key in keys.items():
+            originals.setdefault(key, symbol)
+
+        results: Dict[str, Optional[MarketDataResponse]] = {}
+        fetch_symbols = []
+        now = time.monotonic()
+        cache_get = self.cache.get
+        for key, symbol in originals.items():
+            cached = cache_get(key)
+            if cached and cached[1] + self.stale_ttl > now:
+                self.cache.move_to_end(key)
+                results[key] = cached[0]
+                if not self._is_fresh(key, cached, now):
+                    self.cache_stats["data_stale_hits"] += 1
+                    self._schedule_background_refresh(key, symbol)
+                else:
+                    self.cache_stats["data_hits"] += 1
+            else:
+                fetch_symbols.append((key, symbol))
+        self.cache_stats["data_misses"] += len(fetch_symbols)
+
+        if fetch_symbols:
+            results.update(await self._batch_fetch_symbols(fetch_symbols))
+
+        return {symbol: results.get(key) for symbol, key in keys.items()}
+
+    async def _batch_fetch_symbols(self, symbols: List[Tuple[str, str]]) -> Dict[str, Optional[MarketDataResponse]]:
+        """Fetch missing (cache key, symbol) pairs concurrently through the single-flight path; results keyed by cache key"""
+        async def fetch_one(key: str, symbol: str) -> Optional[MarketDataResponse]:
+            async with self._fetch_sem:
+                return await self._fetch_single_flight(key, symbol)
+
+        fetched = await asyncio.gather(*(fetch_one(k, s) for k, s in symbols), return_exceptions=True)
+        results = {}
+        for (key, symbol), data in zip(symbols, fetched):
+            if isinstance(data, Exception):
+                self.logger.warning(f"⚠️ Batch fetch failed for {symbol}: {data}")
+                data = None
+            results[key] = data
+        return results
+
+    async def _fetch_with_fallback(self, symbol: str) -> Optional[MarketDataResponse]:
+        """Try each API in priority order until one returns data"""
         for api in self.api_endpoints:
-            if api.status == APIStatus.DISABLED:
+            if api.status is APIStatus.DISABLED:
                 continue
                 
             try:
@@ -191,8 +472,6 @@ class UltraRobustMarketAggregator:
                 # Attempt to fetch data
                 result = await self._fetch_from_api(api, symbol)
                 if result:
-                    # Cache successful result
-                    self.cache[cache_key] = (result, time.time())
                     api.success_rate = min(api.success_rate + 0.1, 1.0)
                     self.logger.info(f"✅ SUCCESS: {api.name} provided data for {symbol}: ${result.price:.6f}")
                     return result
@@ -215,8 +494,9 @@ class UltraRobustMarketAggregator:
     async def _fetch_from_api(self, api: APIEndpoint, symbol: str) -> Optional[MarketDataResponse]:
         """Fetch data from specific API with symbol adaptation"""
         
-        if not self.session:
-            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
+        if not self.session or self.session.closed:
+            # Session partagée: keep-alive + cache DNS pour réutiliser les connexions entre symboles
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60)
             self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=api.timeout))
         
         # Adapt symbol format for each API
@@ -244,15 +524,33 @@ class UltraRobustMarketAggregator:
         
         return None
     
+    async def close(self):
+        """Close the shared HTTP session and its connection pool"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
     def _check_rate_limit(self, api: APIEndpoint) -> bool:
-        """Check if API is within rate limits"""
-        now = time.time()
-        if now - api.last_request_time < (60 / api.rate_limit):
+        """Check if API is within rate limits (token bucket, consumes one token when allowed)"""
+        now = time.monotonic()
+        capacity = max(1.0, api.rate_limit / 6)  # Burst autorisé: ~10s de quota
+        if api.rate_tokens is None:
+            api.rate_tokens = capacity
+        else:
+            refill = (now - api.rate_refill_time) * api.rate_limit / 60
+            api.rate_tokens = min(capacity, api.rate_tokens + refill)
+        api.rate_refill_time = now
+        
+        if api.rate_tokens < 1:
             return False
+        api.rate_tokens -= 1
+        api.last_request_time = time.time()
         return True
     
-    def _adapt_symbol_format(self, symbol: str, api_name: str) -> str:
-        """Adapt symbol format for different APIs"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _adapt_symbol_format(symbol: str, api_name: str) -> str:
+        """Adapt symbol format for different APIs (memoized: few symbols x 10 APIs)"""
         # Remove USDT suffix for processing
         base_symbol = symbol.replace('USDT', '').replace('USD', '')
         
@@ -487,20 +785,22 @@ class AdvancedMarketAggregator:
         self.binance_key = os.getenv('BINANCE_KEY')
         
         # Rate limiting et caching
-        self.request_history = defaultdict(deque)  # Track requests per API
+        self.request_history = defaultdict(deque)  # Track requests per API (last minute, monotonic)
         self.cache = {}
         self.cache_ttl = 300  # 5 minutes cache
         
-        # Performance monitoring
-        self.api_performance = {}
+        # Performance monitoring (rollups per API, updated incrementally)
+        self.api_performance: Dict[str, APIResponseStats] = defaultdict(APIResponseStats)
         self.total_requests = 0
         self.successful_requests = 0
         
         # Thread pool for parallel processing
         self.thread_pool = ThreadPoolExecutor(max_workers=20)
+        self.inline_parse_max_bytes = 64 * 1024  # Au-delà, le JSON est décodé hors event loop
         
         # Initialize API endpoints
         self.api_endpoints = self._initialize_api_endpoints()
+        self._endpoints_by_name = {ep.name: ep for ep in self.api_endpoints}
         
         # Initialize CCXT exchanges
         self.exchanges = self._initialize_exchanges()
@@ -785,7 +1085,7 @@ class AdvancedMarketAggregator:
     
     async def _fetch_cmc_listings(self, limit: int) -> List[MarketDataResponse]:
         """Fetch data from CoinMarketCap listings"""
-        endpoint = next((ep for ep in self.api_endpoints if ep.name == "cmc_listings"), None)
+        endpoint = self._endpoints_by_name.get("cmc_listings")
         if not endpoint or not self._can_make_request("cmc_listings"):
             return []
         
@@ -799,13 +1099,12 @@ class AdvancedMarketAggregator:
             }
             
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=endpoint.timeout)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get(endpoint.url, headers=endpoint.headers, params=params) as response:
-                    self._update_request_stats("cmc_listings", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("cmc_listings", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_cmc_listings(data)
+                        return await self._decode_and_parse(response, self._parse_cmc_listings)
                     else:
                         logger.warning(f"CMC listings API returned {response.status}")
                         return []
@@ -828,13 +1127,12 @@ class AdvancedMarketAggregator:
             }
             
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://api.coingecko.com/api/v3/coins/markets", params=params) as response:
-                    self._update_request_stats("coingecko_markets", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("coingecko_markets", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_coingecko_markets(data)
+                        return await self._decode_and_parse(response, self._parse_coingecko_markets)
                     else:
                         return []
                         
@@ -853,15 +1151,14 @@ class AdvancedMarketAggregator:
             
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
                 # Get popular trading pairs
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://rest.coinapi.io/v1/quotes/current", 
                                      headers=headers,
                                      params={"filter_asset_id": "BTC,ETH,BNB,XRP,SOL,ADA,DOGE,TRX,AVAX,MATIC"}) as response:
-                    self._update_request_stats("coinapi_quotes", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("coinapi_quotes", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_coinapi_quotes(data)
+                        return await self._decode_and_parse(response, self._parse_coinapi_quotes)
                     else:
                         return []
                         
@@ -880,14 +1177,13 @@ class AdvancedMarketAggregator:
             params = {"limit": 100, "sort": "volume_24h", "sort_dir": "desc"}
             
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://pro-api.coinmarketcap.com/v4/dex/listings/quotes", 
                                      headers=headers, params=params) as response:
-                    self._update_request_stats("cmc_dex_listings", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("cmc_dex_listings", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_cmc_dex_data(data)
+                        return await self._decode_and_parse(response, self._parse_cmc_dex_data)
                     else:
                         return []
                         
@@ -921,7 +1217,7 @@ class AdvancedMarketAggregator:
     async def _fetch_single_exchange_data(self, exchange_name: str, exchange) -> List[MarketDataResponse]:
         """Fetch data from a single exchange"""
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             # Run in thread pool to avoid blocking
             tickers = await loop.run_in_executor(
@@ -956,7 +1252,7 @@ class AdvancedMarketAggregator:
     async def _fetch_yahoo_finance_crypto(self) -> List[MarketDataResponse]:
         """Fetch major crypto data from Yahoo Finance"""
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             # Major crypto symbols on Yahoo Finance
             symbols = ['BTC-USD', 'ETH-USD', 'BNB-USD', 'XRP-USD', 'SOL-USD', 
@@ -996,6 +1292,16 @@ class AdvancedMarketAggregator:
             logger.error(f"Error fetching Yahoo Finance crypto data: {e}")
             return []
     
+    async def _decode_and_parse(self, response: aiohttp.ClientResponse, parser) -> List[MarketDataResponse]:
+        """Decode and parse a JSON payload, off the event loop when it is large"""
+        raw = await response.read()
+        if len(raw) < self.inline_parse_max_bytes:
+            return parser(json.loads(raw))
+        
+        # Gros payloads (listings 250-5000 entrées): décodage + parsing dans le thread pool
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_pool, lambda: parser(json.loads(raw)))
+    
     def _parse_cmc_listings(self, data: Dict) -> List[MarketDataResponse]:
         """Parse CoinMarketCap listings response"""
         parsed_data = []
@@ -1173,8 +1479,7 @@ class AdvancedMarketAggregator:
                 async with session.get("https://api.coingecko.com/api/v3/coins/markets",
                                      params={"vs_currency": "usd", "per_page": limit, "page": 1}) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_coingecko_markets(data)
+                        return await self._decode_and_parse(response, self._parse_coingecko_markets)
         except Exception as e:
             logger.error(f"Fallback CoinGecko request failed: {e}")
         
@@ -1184,16 +1489,18 @@ class AdvancedMarketAggregator:
     def _can_make_request(self, api_name: str) -> bool:
         """Check if we can make a request to the API (rate limiting)"""
         now = time.time()
-        endpoint = next((ep for ep in self.api_endpoints if ep.name == api_name), None)
+        endpoint = self._endpoints_by_name.get(api_name)
         
-        if not endpoint or endpoint.status != APIStatus.ACTIVE:
+        if not endpoint or endpoint.status is not APIStatus.ACTIVE:
             return False
         
         # Check rate limiting
-        requests_in_last_minute = len([t for t in self.request_history[api_name] 
-                                     if now - t < 60])
+        history = self.request_history[api_name]
+        mono_now = time.monotonic()
+        while history and mono_now - history[0] >= 60:
+            history.popleft()
         
-        if requests_in_last_minute >= endpoint.rate_limit:
+        if len(history) >= endpoint.rate_limit:
             return False
         
         # Check if recently failed
@@ -1207,14 +1514,17 @@ class AdvancedMarketAggregator:
     def _update_request_stats(self, api_name: str, response_time: float, success: bool):
         """Update request statistics for an API"""
         now = time.time()
-        self.request_history[api_name].append(now)
+        history = self.request_history[api_name]
+        mono_now = time.monotonic()
+        history.append(mono_now)
         
-        # Keep only last hour of requests
-        self.request_history[api_name] = deque([
-            t for t in self.request_history[api_name] if now - t < 3600
-        ])
+        # Keep only the last minute of requests (pruned in place, oldest first)
+        while history and mono_now - history[0] >= 60:
+            history.popleft()
+        
+        self.api_performance[api_name].record(response_time)
         
-        endpoint = next((ep for ep in self.api_endpoints if ep.name == api_name), None)
+        endpoint = self._endpoints_by_name.get(api_name)
         if endpoint:
             endpoint.last_request_time = now
             endpoint.request_count += 1
@@ -1241,6 +1551,7 @@ class AdvancedMarketAggregator:
         }
         
         for endpoint in self.api_endpoints:
+            perf = self.api_performance.get(endpoint.name)
             stats["api_endpoints"].append({
                 "name": endpoint.name,
                 "status": endpoint.status.value,
@@ -1248,7 +1559,9 @@ class AdvancedMarketAggregator:
                 "success_rate": endpoint.success_rate,
                 "error_count": endpoint.error_count,
                 "last_request": endpoint.last_request_time,
-                "priority": endpoint.priority
+                "priority": endpoint.priority,
+                "avg_response_time": perf.avg_time if perf else 0,
+                "max_response_time": perf.max_time if perf else 0
             })
         
         return stats
@@ -1257,14 +1570,13 @@ class AdvancedMarketAggregator:
         """Fetch data from CoinCap API (free alternative)"""
         try:
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://api.coincap.io/v2/assets", 
                                      params={"limit": 100}) as response:
-                    self._update_request_stats("coincap_assets", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("coincap_assets", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_coincap_data(data)
+                        return await self._decode_and_parse(response, self._parse_coincap_data)
                     else:
                         return []
                         
@@ -1277,14 +1589,13 @@ class AdvancedMarketAggregator:
         """Fetch data from CryptoCompare API (free tier)"""
         try:
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://min-api.cryptocompare.com/data/top/mktcapfull", 
                                      params={"limit": 50, "tsym": "USD"}) as response:
-                    self._update_request_stats("cryptocompare_top", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("cryptocompare_top", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_cryptocompare_data(data)
+                        return await self._decode_and_parse(response, self._parse_cryptocompare_data)
                     else:
                         return []
                         
@@ -1297,13 +1608,12 @@ class AdvancedMarketAggregator:
         """Fetch trending data from CoinGecko"""
         try:
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://api.coingecko.com/api/v3/search/trending") as response:
-                    self._update_request_stats("coingecko_trending", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("coingecko_trending", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_coingecko_trending_data(data)
+                        return await self._decode_and_parse(response, self._parse_coingecko_trending_data)
                     else:
                         return []
                         
@@ -1409,14 +1719,13 @@ class AdvancedMarketAggregator:
             params = {"limit": 100, "sort": "volume_24h", "sort_dir": "desc"}
             
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://pro-api.coinmarketcap.com/v4/dex/listings/info", 
                                      headers=headers, params=params) as response:
-                    self._update_request_stats("cmc_dex_info", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("cmc_dex_info", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_cmc_dex_info_data(data)
+                        return await self._decode_and_parse(response, self._parse_cmc_dex_info_data)
                     else:
                         logger.warning(f"CMC DEX info API returned {response.status}")
                         return []
@@ -1436,14 +1745,13 @@ class AdvancedMarketAggregator:
             params = {"limit": 50}
             
             async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 async with session.get("https://pro-api.coinmarketcap.com/v4/dex/pairs/trade/latest", 
                                      headers=headers, params=params) as response:
-                    self._update_request_stats("cmc_dex_trades", time.time() - start_time, response.status == 200)
+                    self._update_request_stats("cmc_dex_trades", time.perf_counter() - start_time, response.status == 200)
                     
                     if response.status == 200:
-                        data = await response.json()
-                        return self._parse_cmc_dex_trades_data(data)
+                        return await self._decode_and_parse(response, self._parse_cmc_dex_trades_data)
                     else:
                         logger.warning(f"CMC DEX trades API returned {response.status}")
                         return []
@@ -319,16 +319,28 @@ class AdvancedTechnicalIndicators:
             df['ema_cross_signal'] = 'neutral'
             df['trend_strength_score'] = 0.5
             
+            # Colonnes et index résolus une fois : la boucle ne fait plus que des lectures locales
+            closes = df['Close'].to_numpy()
+            ema9_values = df['ema_9'].to_numpy()
+            ema21_values = df['ema_21'].to_numpy()
+            sma50_values = df['sma_50'].to_numpy()
+            ema200_values = df['ema_200'].to_numpy()
+            index = df.index
+            loc = df.loc
+            
+            # Need enough data for EMA200 - use dynamic check
+            warmup = min(200, len(df) * 0.8)  # Use 80% of data or 200, whichever is smaller
+            
             for i in range(len(df)):
-                # Need enough data for EMA200 - use dynamic check
-                if i < min(200, len(df) * 0.8):  # Use 80% of data or 200, whichever is smaller
+                if i < warmup:
                     continue
                     
-                price = df['Close'].iloc[i]
-                ema9 = df['ema_9'].iloc[i]
-                ema21 = df['ema_21'].iloc[i]
-                sma50 = df['sma_50'].iloc[i]
-                ema200 = df['ema_200'].iloc[i]
+                price = closes[i]
+                ema9 = ema9_values[i]
+                ema21 = ema21_values[i]
+                sma50 = sma50_values[i]
+                ema200 = ema200_values[i]
+                row = index[i]
                 
                 # Skip if any EMA is NaN
                 if pd.isna(ema9) or pd.isna(ema21) or pd.isna(sma50) or pd.isna(ema200):
@@ -343,13 +355,13 @@ class AdvancedTechnicalIndicators:
                 ])
                 
                 if emas_above_price == 4:
-                    df.loc[df.index[i], 'price_vs_emas'] = 'above_all'
+                    loc[row, 'price_vs_emas'] = 'above_all'
                 elif emas_above_price >= 2:
-                    df.loc[df.index[i], 'price_vs_emas'] = 'above_fast'
+                    loc[row, 'price_vs_emas'] = 'above_fast'
                 elif emas_above_price == 1:
-                    df.loc[df.index[i], 'price_vs_emas'] = 'below_fast'
+                    loc[row, 'price_vs_emas'] = 'below_fast'
                 else:
-                    df.loc[df.index[i], 'price_vs_emas'] = 'below_all'
+                    loc[row, 'price_vs_emas'] = 'below_all'
                 
                 # === TREND HIERARCHY STRENGTH ===
                 # Perfect bull alignment: EMA9 > EMA21 > SMA50 > EMA200
@@ -359,19 +371,19 @@ class AdvancedTechnicalIndicators:
                 if sma50 > ema200: bull_alignment_score += 0.25
                 if price > ema9: bull_alignment_score += 0.25
                 
-                df.loc[df.index[i], 'trend_strength_score'] = bull_alignment_score
+                loc[row, 'trend_strength_score'] = bull_alignment_score
                 
                 # === TREND HIERARCHY CLASSIFICATION ===
                 if bull_alignment_score >= 0.8:
-                    df.loc[df.index[i], 'trend_hierarchy'] = 'strong_bull'
+                    loc[row, 'trend_hierarchy'] = 'strong_bull'
                 elif bull_alignment_score >= 0.6:
-                    df.loc[df.index[i], 'trend_hierarchy'] = 'weak_bull'
+                    loc[row, 'trend_hierarchy'] = 'weak_bull'
                 elif bull_alignment_score <= 0.2:
-                    df.loc[df.index[i], 'trend_hierarchy'] = 'strong_bear'
+                    loc[row, 'trend_hierarchy'] = 'strong_bear'
                 elif bull_alignment_score <= 0.4:
-                    df.loc[df.index[i], 'trend_hierarchy'] = 'weak_bear'
+                    loc[row, 'trend_hierarchy'] = 'weak_bear'
                 else:
-                    df.loc[df.index[i], 'trend_hierarchy'] = 'neutral'
+                    loc[row, 'trend_hierarchy'] = 'neutral'
             
             # === MOMENTUM ANALYSIS (Rate of Change in EMAs) ===
             df['ema9_slope'] = df['ema_9'].pct_change(periods=3) * 100  # 3-period slope
@@ -429,14 +441,18 @@ class AdvancedTechnicalIndicators:
         df['volume_ratio'] = df['Volume'] / df['volume_sma']
         
         # On Balance Volume (OBV)
-        df['obv'] = 0.0
+        # Cumul sur des tableaux locaux puis une seule écriture de colonne
+        closes = df['Close'].to_numpy()
+        volumes = df['Volume'].to_numpy()
+        obv = np.zeros(len(df))
         for i in range(1, len(df)):
-            if df['Close'].iloc[i] > df['Close'].iloc[i-1]:
-                df.loc[df.index[i], 'obv'] = df['obv'].iloc[i-1] + df['Volume'].iloc[i]
-            elif df['Close'].iloc[i] < df['Close'].iloc[i-1]:
-                df.loc[df.index[i], 'obv'] = df['obv'].iloc[i-1] - df['Volume'].iloc[i]
+            if closes[i] > closes[i-1]:
+                obv[i] = obv[i-1] + volumes[i]
+            elif closes[i] < closes[i-1]:
+                obv[i] = obv[i-1] - volumes[i]
             else:
-                df.loc[df.index[i], 'obv'] = df['obv'].iloc[i-1]
+                obv[i] = obv[i-1]
+        df['obv'] = obv
         
         return df
     
@@ -1024,16 +1024,17 @@ class AIPerformanceEnhancer:
     
     def _check_rule_conditions(self, conditions: Dict[str, Any], context: Dict[str, Any]) -> bool:
         """Check if rule conditions match the given context"""
+        # Every condition key must exist in the context: one key-view subset test
+        if not conditions.keys() <= context.keys():
+            return False
+        
         for key, value in conditions.items():
-            if key not in context:
-                return False
-            
             context_value = context[key]
             
             if isinstance(value, list):
                 # Check if any of the context values match
                 if isinstance(context_value, list):
-                    if not any(item in value for item in context_value):
+                    if set(context_value).isdisjoint(value):
                         return False
                 else:
                     if context_value not in value:
@@ -1052,8 +1053,8 @@ class AIPerformanceEnhancer:
             # Vérifier les patterns détectés
             if 'patterns_detected' in conditions:
                 required_patterns = conditions['patterns_detected']
-                detected_patterns = analysis.get('patterns_detected', [])
-                if not any(pattern in detected_patterns for pattern in required_patterns):
+                detected_patterns = set(analysis.get('patterns_detected', []))
+                if detected_patterns.isdisjoint(required_patterns):
                     return False
             
             # Vérifier les conditions de marché
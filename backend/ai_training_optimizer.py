@@ -213,7 +213,7 @@ class AITrainingOptimizer:
         except Exception as e:
             logger.error(f"Error saving insights to cache: {e}")
     
-    async def get_quick_training_status(self) -> Dict[str, Any]:
+    def get_quick_training_status(self) -> Dict[str, Any]:
         """Get quick training status without heavy computation"""
         return {
             'success': True,
@@ -267,7 +267,7 @@ class AITrainingOptimizer:
         """Get enhancement rules for the performance enhancer"""
         return self.cached_insights.get('enhancement_rules', [])
     
-    async def get_market_conditions(self) -> List[Dict[str, Any]]:
+    def get_market_conditions(self) -> List[Dict[str, Any]]:
         """Get market condition data"""
         conditions = []
         
@@ -288,7 +288,7 @@ class AITrainingOptimizer:
         
         return conditions
     
-    async def get_pattern_training(self) -> List[Dict[str, Any]]:
+    def get_pattern_training(self) -> List[Dict[str, Any]]:
         """Get pattern training results"""
         patterns = []
         
@@ -315,7 +315,7 @@ class AITrainingOptimizer:
         
         return patterns
     
-    async def get_ia1_enhancements(self) -> List[Dict[str, Any]]:
+    def get_ia1_enhancements(self) -> List[Dict[str, Any]]:
         """Get IA1 enhancement data"""
         enhancements = []
         
@@ -343,7 +343,7 @@ class AITrainingOptimizer:
         
         return enhancements
     
-    async def get_ia2_enhancements(self) -> List[Dict[str, Any]]:
+    def get_ia2_enhancements(self) -> List[Dict[str, Any]]:
         """Get IA2 enhancement data"""
         enhancements = []
         
@@ -6,12 +6,13 @@ for automated cryptocurrency trading with BingX Futures API.
 
 import os
 import asyncio
+import random
 import hmac
 import hashlib
 import time
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -22,35 +23,6 @@ from pydantic import BaseModel
 # Setup logging
 logger = logging.getLogger(__name__)
 
-def get_correct_timestamp():
-    """Get correct timestamp in milliseconds for BingX API using server time synchronization"""
-    # Use BingX server time endpoint for proper synchronization
-    
-    import requests
-    
-    try:
-        # Get BingX server time (this endpoint doesn't require authentication)
-        response = requests.get("https://open-api.bingx.com/openApi/swap/v2/server/time", timeout=5)
-        
-        if response.status_code == 200:
-            server_response = response.json()
-            
-            # BingX returns: {"code":0,"msg":"","data":{"serverTime":1757528441651}}
-            if server_response.get('code') == 0 and 'data' in server_response:
-                server_time = server_response['data'].get('serverTime')
-                
-                if server_time:
-                    logger.debug(f"🕐 BINGX SERVER TIME: {server_time}")
-                    return int(server_time)
-        
-        # Fallback to system time if server time fails
-        logger.warning("⚠️ Failed to get BingX server time, using system time")
-        return int(time.time() * 1000)
-        
-    except Exception as e:
-        logger.warning(f"⚠️ Error getting BingX server time: {e}, using system time")
-        return int(time.time() * 1000)
-
 class OrderSide(Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -179,6 +151,9 @@ class BingXTradingClient:
         self.emergency_stop_triggered = False
         self.risk_params = RiskParameters()
         
+        # Subscribers notified of every live price fetched from BingX (symbol, price)
+        self.price_listeners: List[Callable[[str, float], None]] = []
+        
         # HTTP client for API calls
         self.client = httpx.AsyncClient(timeout=30.0)
     
@@ -190,8 +165,27 @@ class BingXTradingClient:
         """Async context manager exit"""
         await self.client.aclose()
     
-    async def _make_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Dict:
-        """Make authenticated request to BingX API with rate limiting - BingX Official Format"""
+    async def _server_timestamp(self) -> int:
+        """BingX server time in ms via the shared async client - never blocks the event loop"""
+        try:
+            response = await self.client.get(f"{self.authenticator.base_url}/openApi/swap/v2/server/time", timeout=5.0)
+            
+            if response.status_code == 200:
+                server_response = response.json()
+                if server_response.get('code') == 0 and 'data' in server_response:
+                    server_time = server_response['data'].get('serverTime')
+                    if server_time:
+                        return int(server_time)
+            
+            logger.warning("⚠️ Failed to get BingX server time, using system time")
+        except Exception as e:
+            logger.warning(f"⚠️ Error getting BingX server time: {e}, using system time")
+        return int(time.time() * 1000)
+    
+    async def _make_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None,
+                            time_offset_ms: Optional[int] = None) -> Dict:
+        """Make authenticated request to BingX API with rate limiting - BingX Official Format
+        time_offset_ms: server-local clock offset already measured by the caller (skips the server-time GET)"""
         await self.rate_limiter.acquire()
         
         url = f"{self.authenticator.base_url}{endpoint}"
@@ -205,7 +199,10 @@ class BingXTradingClient:
             all_params.update(data)  # BingX puts ALL parameters in query string, not body!
         
         # Add timestamp (BingX requirement) - Get fresh timestamp just before signature
-        all_params['timestamp'] = get_correct_timestamp()
+        if time_offset_ms is None:
+            all_params['timestamp'] = await self._server_timestamp()
+        else:
+            all_params['timestamp'] = int(time.time() * 1000) + time_offset_ms
         
         # Sort parameters alphabetically by key (BingX requirement for consistent signature)
         sorted_params = sorted(all_params.items(), key=lambda x: x[0])
@@ -300,7 +297,13 @@ class BingXTradingClient:
             result = await self._make_request("GET", "/openApi/swap/v2/quote/ticker", {"symbol": symbol})
             
             if 'data' in result:
-                return float(result['data']['lastPrice'])
+                price = float(result['data']['lastPrice'])
+                for listener in self.price_listeners:
+                    try:
+                        listener(symbol, price)
+                    except Exception as e:
+                        logger.warning(f"Price listener failed for {symbol}: {e}")
+                return price
             else:
                 raise Exception(f"No price data for {symbol}")
         
@@ -342,8 +345,8 @@ class BingXTradingClient:
                 "positionSide": position_side,
                 "type": "MARKET",
                 "quantity": str(position.quantity),  # BingX expects string format
-                "recvWindow": 5000,  # Add recvWindow parameter (5 seconds tolerance)
-                "timestamp": get_correct_timestamp()  # Use BingX server time
+                "recvWindow": 5000  # Add recvWindow parameter (5 seconds tolerance)
+                # timestamp: added by _make_request from BingX server time just before signing
             }
             
             logger.info(f"🚀 PLACING BINGX ORDER: {order_data}")
@@ -425,16 +428,20 @@ class BingXTradingClient:
     
     async def monitor_order(self, order_id: str):
         """Monitor order status and update position when filled"""
-        max_checks = 60  # Monitor for up to 60 iterations (5 minutes)
-        check_interval = 5  # Check every 5 seconds
+        deadline = time.monotonic() + 300  # Monitor for up to 5 minutes
+        check_interval = 1.0  # Backoff: ~1s, 2s, 4s, then every 5s (±10% jitter)
+        max_check_interval = 5
+        # Un seul aller-retour server-time par suivi: les requêtes de statut réutilisent le décalage d'horloge
+        time_offset_ms = await self._server_timestamp() - int(time.time() * 1000)
         
-        for _ in range(max_checks):
+        while time.monotonic() < deadline:
             try:
                 if order_id not in self.pending_orders:
                     break
                 
                 # Check order status
-                result = await self._make_request("GET", "/openApi/swap/v2/trade/order", {"orderId": order_id})
+                result = await self._make_request("GET", "/openApi/swap/v2/trade/order", {"orderId": order_id},
+                                                  time_offset_ms=time_offset_ms)
                 
                 if 'data' in result:
                     order_data = result['data']
@@ -454,12 +461,12 @@ class BingXTradingClient:
                         self.order_history.append(order_state)
                         del self.pending_orders[order_id]
                         break
-                
-                await asyncio.sleep(check_interval)
             
             except Exception as e:
                 logger.error(f"Error monitoring order {order_id}: {e}")
-                await asyncio.sleep(check_interval)
+            
+            await asyncio.sleep(check_interval * random.uniform(0.9, 1.1))
+            check_interval = min(check_interval * 2, max_check_interval)
     
     async def update_position(self, order_state: OrderState):
         """Update position based on filled order"""
@@ -692,6 +699,11 @@ class BingXIntegrationManager:
         self.trading_client = None
         self.risk_manager = None
         self._initialized = False
+        self._price_listeners: List[Callable[[str, float], None]] = []
+    
+    def add_price_listener(self, listener: Callable[[str, float], None]):
+        """Subscribe to live BingX prices (called with symbol, price)"""
+        self._price_listeners.append(listener)
     
     async def initialize(self):
         """Initialize the BingX integration system"""
@@ -700,6 +712,7 @@ class BingXIntegrationManager:
         
         try:
             self.trading_client = BingXTradingClient()
+            self.trading_client.price_listeners = self._price_listeners
             self.risk_manager = RiskManager(self.trading_client)
             
             # Test API connectivity
@@ -1,9 +1,10 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import time
 import logging
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,17 @@ class BingXFuturesFetcher:
         }  # Tokens à éviter
         self.cache_file = "/app/backend/bingx_tradable_symbols.json"
         self.cache_time_file = "/app/backend/bingx_cache_time.txt"
+        self.cache_max_age_hours = 6
+        self.api_retry_seconds = 300  # Après un échec API, pas de nouvel essai avant ce délai
+        
+        # Session keep-alive: connexion TCP/TLS réutilisée entre les rafraîchissements
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        
+        # Copie mémoire: évite de relire les fichiers cache à chaque vérification de symbole
+        self._symbols: List[str] = []
+        self._symbol_set: Set[str] = set()
+        self._valid_until = 0.0
         
     def get_available_symbols(self) -> List[Dict]:
         """Récupère tous les symboles futures disponibles sur BingX"""
@@ -28,7 +40,7 @@ class BingXFuturesFetcher:
         
         try:
             logger.info(f"🔍 Récupération symboles BingX depuis {url}")
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -115,11 +127,21 @@ class BingXFuturesFetcher:
             logger.error(f"❌ Erreur lecture cache BingX: {e}")
             return []
     
+    def _read_cache_time(self) -> float:
+        """Horodatage (time.time) de la dernière mise à jour du cache fichier"""
+        with open(self.cache_time_file, 'r') as f:
+            return float(f.read())
+    
+    def _remember(self, symbols: List[str], updated_at: float, ttl_seconds: Optional[float] = None):
+        """Garde la liste en mémoire jusqu'à l'expiration du cache (ou pendant ttl_seconds)"""
+        self._symbols = symbols
+        self._symbol_set = set(symbols)
+        self._valid_until = updated_at + (self.cache_max_age_hours * 3600 if ttl_seconds is None else ttl_seconds)
+    
     def is_cache_valid(self, max_age_hours: int = 6) -> bool:
         """Vérifie si le cache est encore valide"""
         try:
-            with open(self.cache_time_file, 'r') as f:
-                cache_time = float(f.read())
+            cache_time = self._read_cache_time()
             
             age_hours = (time.time() - cache_time) / 3600
             is_valid = age_hours < max_age_hours
@@ -138,10 +160,23 @@ class BingXFuturesFetcher:
         Récupère les symboles tradables avec système de cache intelligent
         force_update: Force la mise à jour depuis l'API même si cache valide
         """
+        # Copie: l'appelant ne peut pas modifier la liste mémorisée (ni désynchroniser _symbol_set)
+        return list(self._load_symbols(force_update))
+    
+    def _load_symbols(self, force_update: bool = False) -> List[str]:
+        """Liste mémorisée, cache fichier ou API BingX (la liste retournée peut être la copie mémoire interne)"""
+        # Copie mémoire encore valide: aucun accès fichier
+        if not force_update and self._symbols and time.time() < self._valid_until:
+            return self._symbols
+        
         # Utiliser le cache si valide et pas de force update
-        if not force_update and self.is_cache_valid():
+        if not force_update and self.is_cache_valid(self.cache_max_age_hours):
             cached_symbols = self.load_from_cache()
             if cached_symbols:
+                try:
+                    self._remember(cached_symbols, self._read_cache_time())
+                except Exception as e:
+                    logger.error(f"❌ Erreur lecture horodatage cache: {e}")
                 return cached_symbols
         
         # Récupérer depuis l'API BingX
@@ -151,17 +186,24 @@ class BingXFuturesFetcher:
         if not all_symbols:
             # Fallback sur cache même expiré si API échoue
             logger.warning("⚠️ API BingX échouée, utilisation cache expiré")
-            return self.load_from_cache()
+            stale_symbols = self.load_from_cache()
+            if stale_symbols:
+                # Mémorisé brièvement: chaque vérification de symbole ne relance pas l'appel API (timeout 10s)
+                self._remember(stale_symbols, time.time(), ttl_seconds=self.api_retry_seconds)
+            return stale_symbols
         
         # Filtrer et sauvegarder
         tradable_symbols = self.filter_symbols(all_symbols)
         self.save_to_cache(tradable_symbols)
+        self._remember(tradable_symbols, time.time())
         
         return tradable_symbols
     
     def is_symbol_tradable(self, symbol: str) -> bool:
         """Vérifie si un symbole spécifique est tradable sur BingX - Format flexible"""
-        tradable_symbols = self.get_tradable_symbols()
+        tradable_symbols = self._load_symbols()
+        if tradable_symbols is self._symbols:
+            tradable_symbols = self._symbol_set  # Tests d'appartenance O(1)
         
         # Test direct
         if symbol in tradable_symbols:
@@ -18,9 +18,11 @@ import pandas as pd
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+from contextlib import asynccontextmanager
 from enum import Enum
 import json
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -116,8 +118,13 @@ class GlobalCryptoMarketAnalyzer:
         self.binance_base_url = "https://api.binance.com/api/v3"
         
         # Cache pour éviter trop d'appels API
-        self.cache = {}
+        self.cache: Dict[str, Tuple[object, float]] = {}  # key -> (data, expires_at monotonic), tuple sans __dict__ par entrée
         self.cache_duration = 300  # 5 minutes
+        self._inflight: Dict[str, asyncio.Future] = {}  # cache_key -> fetch en cours
+        
+        # Session HTTP partagée (keep-alive) au lieu d'une session par appel API
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Boucle à laquelle _inflight et _session sont liés
         
         # Configuration seuils
         self.config = {
@@ -133,19 +140,75 @@ class GlobalCryptoMarketAnalyzer:
         """
         🎯 FONCTION PRINCIPALE: Récupérer et analyser les conditions globales du marché
         """
+        # Vérifier cache
+        cache_key = "global_market_data"
+        if self._is_cache_valid(cache_key):
+            logger.info("📦 Using cached global market data")
+            return self.cache[cache_key][0]
+        
+        # Un seul fetch en vol: les analyses IA1/IA2 concurrentes attendent le même résultat
+        self._ensure_loop_state()
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_global_market_data(cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda t: self._release_inflight(cache_key, t))
+        return await asyncio.shield(task)
+    
+    def _ensure_loop_state(self):
+        """Rebind loop-bound state (in-flight fetches, HTTP session) when called from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        previous_loop, self._loop = self._loop, loop
+        # Un fetch lancé sur l'ancienne boucle ne peut pas être attendu depuis celle-ci
+        self._inflight.clear()
+        old_session, self._session = self._session, None
+        if old_session is not None and not old_session.closed:
+            if previous_loop is not None and previous_loop.is_running():
+                # Ancienne boucle encore active (autre thread): fermeture planifiée sur celle-ci
+                previous_loop.call_soon_threadsafe(lambda: asyncio.ensure_future(old_session.close()))
+            else:
+                # Boucle arrêtée ou fermée: aucun callback n'y tournera. Fermeture synchrone des transports
+                # (partie non-async de close(), aiohttp 3.x) puis détachement: rien n'attend l'ancienne boucle
+                connector = old_session.connector
+                old_session.detach()
+                if connector is not None:
+                    connector._close()
+    
+    @asynccontextmanager
+    async def _http_session(self):
+        """Yield the pooled session, recreated if closed or bound to another event loop"""
+        self._ensure_loop_state()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=20)
+            )
+        yield self._session
+    
+    async def close(self):
+        """Close the pooled HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _release_inflight(self, cache_key: str, task: asyncio.Future):
+        """Forget a finished fetch unless a newer one already replaced it"""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+    
+    async def _fetch_global_market_data(self, cache_key: str) -> Optional[GlobalMarketData]:
+        """Fetch sources, analyse and cache the global market data"""
         try:
             logger.info("🌍 Fetching global crypto market data...")
             
-            # Vérifier cache
-            cache_key = "global_market_data"
-            if self._is_cache_valid(cache_key):
-                logger.info("📦 Using cached global market data")
-                return self.cache[cache_key]["data"]
-            
-            # Récupérer données en parallèle
-            coingecko_data = await self._fetch_coingecko_global_data()
-            fear_greed_data = await self._fetch_fear_greed_index() 
-            btc_historical_data = await self._fetch_btc_historical_data()
+            # Récupérer données en parallèle (sources indépendantes, chacune gère ses erreurs)
+            coingecko_data, fear_greed_data, btc_historical_data = await asyncio.gather(
+                self._fetch_coingecko_global_data(),
+                self._fetch_fear_greed_index(),
+                self._fetch_btc_historical_data()
+            )
             
             if not coingecko_data:
                 logger.error("❌ Failed to fetch CoinGecko data")
@@ -221,10 +284,7 @@ class GlobalCryptoMarketAnalyzer:
             )
             
             # Mettre en cache
-            self.cache[cache_key] = {
-                "timestamp": datetime.now(timezone.utc),
-                "data": global_market_data
-            }
+            self.cache[cache_key] = (global_market_data, time.monotonic() + self.cache_duration)
             
             logger.info(f"✅ Global market analysis completed: {market_regime.value}, Sentiment: {market_sentiment.value}")
             return global_market_data
@@ -236,7 +296,7 @@ class GlobalCryptoMarketAnalyzer:
     async def _fetch_coingecko_global_data(self) -> Optional[Dict]:
         """Récupérer données globales depuis CoinGecko"""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
+            async with self._http_session() as session:
                 
                 # Global data endpoint
                 global_url = f"{self.coingecko_base_url}/global"
@@ -261,7 +321,7 @@ class GlobalCryptoMarketAnalyzer:
         try:
             logger.info("🚨 FALLBACK CRITIQUE ACTIVÉ - Récupération données essentielles (24h/BTC/MarketCap/Volume)")
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=20)) as session:
+            async with self._http_session() as session:
                 
                 # 🎯 PRIORITÉ 1: Prix Bitcoin + Variation 24h (BINANCE - LE PLUS FIABLE)
                 btc_data = await self._get_critical_btc_data(session)
@@ -418,7 +478,7 @@ class GlobalCryptoMarketAnalyzer:
     async def _fetch_fear_greed_index(self) -> Optional[Dict]:
         """Récupérer Fear & Greed Index"""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+            async with self._http_session() as session:
                 
                 # Fear & Greed endpoint 
                 async with session.get(f"{self.fear_greed_url}?limit=1") as response:
@@ -439,7 +499,7 @@ class GlobalCryptoMarketAnalyzer:
     async def _fetch_btc_historical_data(self) -> Optional[Dict]:
         """Récupérer données historiques Bitcoin depuis CoinGecko avec fallback Binance"""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
+            async with self._http_session() as session:
                 
                 # Essayer CoinGecko d'abord
                 btc_url = f"{self.coingecko_base_url}/coins/bitcoin"
@@ -473,7 +533,7 @@ class GlobalCryptoMarketAnalyzer:
                         
         except Exception as e:
             logger.error(f"Error fetching Bitcoin historical data: {e}")
-            async with aiohttp.ClientSession() as session:
+            async with self._http_session() as session:
                 return await self._fetch_btc_binance_fallback(session)
     
     async def _fetch_btc_binance_fallback(self, session: aiohttp.ClientSession) -> Optional[Dict]:
@@ -1011,18 +1071,18 @@ SCORE BULL/BEAR: {bull_bear_score:+.1f}/100 {'(Momentum BULLISH)' if bull_bear_s
             # 3. MÉTHODE COMPOSITE: Calcul basé sur moyennes de marché
             try:
                 # Utiliser des données de fallback Binance pour estimer
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+                async with self._http_session() as session:
                     # Récupérer données BTC et ETH pour estimation composite
                     btc_ticker_url = "https://api.binance.com/api/v3/ticker/24hr?symbol=BTCUSDT"
                     eth_ticker_url = "https://api.binance.com/api/v3/ticker/24hr?symbol=ETHUSDT"
                     
-                    btc_response = await session.get(btc_ticker_url)
-                    eth_response = await session.get(eth_ticker_url)
+                    async with session.get(btc_ticker_url) as btc_response, session.get(eth_ticker_url) as eth_response:
+                        tickers_ok = btc_response.status == 200 and eth_response.status == 200
+                        if tickers_ok:
+                            btc_binance = await btc_response.json()
+                            eth_binance = await eth_response.json()
                     
-                    if btc_response.status == 200 and eth_response.status == 200:
-                        btc_binance = await btc_response.json()
-                        eth_binance = await eth_response.json()
-                        
+                    if tickers_ok:
                         btc_change = float(btc_binance.get('priceChangePercent', 0))
                         eth_change = float(eth_binance.get('priceChangePercent', 0))
                         
@@ -1055,12 +1115,12 @@ SCORE BULL/BEAR: {bull_bear_score:+.1f}/100 {'(Momentum BULLISH)' if bull_bear_s
 
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Vérifier si le cache est encore valide"""
-        if cache_key not in self.cache:
+        cached = self.cache.get(cache_key)
+        if cached is None:
             return False
         
-        cache_time = self.cache[cache_key]["timestamp"]
-        now = datetime.now(timezone.utc)
-        return (now - cache_time).total_seconds() < self.cache_duration
+        # Horloge monotone: pas d'allocation datetime ni de sensibilité aux ajustements d'heure système
+        return time.monotonic() < cached[1]
     
     async def get_market_context_for_ias(self) -> str:
         """
@@ -6,6 +6,7 @@ import os
 import logging
 import asyncio
 import json
+import time
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
@@ -13,6 +14,7 @@ import uuid
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from dataclasses import dataclass, field
+from collections import Counter
 import pytz
 
 # Configuration du fuseau horaire de Paris
@@ -2212,11 +2214,11 @@ class UltraProfessionalIA1TechnicalAnalyst:
                 primary_resistance = float(rr_analysis.get('primary_resistance', opportunity.current_price * 1.03))
                 
                 # 🎯 ASSIGNATION DES PRIX SELON LE SIGNAL IA1
-                if ia1_signal.lower() == 'long':
+                if ia1_signal == 'long':
                     # LONG: Entry = current, SL = support, TP = resistance
                     stop_loss_price = primary_support
                     take_profit_price = primary_resistance
-                elif ia1_signal.lower() == 'short':
+                elif ia1_signal == 'short':
                     # SHORT: Entry = current, SL = resistance, TP = support  
                     stop_loss_price = primary_resistance
                     take_profit_price = primary_support
@@ -2246,10 +2248,10 @@ class UltraProfessionalIA1TechnicalAnalyst:
                 primary_resistance = resistance_levels[0] if resistance_levels else opportunity.current_price * 1.03
                 
                 # Assignation des prix selon le signal
-                if ia1_signal.lower() == 'long':
+                if ia1_signal == 'long':
                     stop_loss_price = primary_support
                     take_profit_price = primary_resistance
-                elif ia1_signal.lower() == 'short':
+                elif ia1_signal == 'short':
                     stop_loss_price = primary_resistance
                     take_profit_price = primary_support
                 else:  # hold
@@ -2349,10 +2351,10 @@ class UltraProfessionalIA1TechnicalAnalyst:
             if ia1_calculated_levels:
                 entry_price = ia1_calculated_levels.get('entry_price', opportunity.current_price)
                 
-                if ia1_signal.lower() == "long":
+                if ia1_signal == "long":
                     stop_loss_price = ia1_calculated_levels.get('primary_support', opportunity.current_price * 0.97)
                     take_profit_price = ia1_calculated_levels.get('primary_resistance', opportunity.current_price * 1.03)
-                elif ia1_signal.lower() == "short":
+                elif ia1_signal == "short":
                     stop_loss_price = ia1_calculated_levels.get('primary_resistance', opportunity.current_price * 1.03)
                     take_profit_price = ia1_calculated_levels.get('primary_support', opportunity.current_price * 0.97)
                 else:  # hold
@@ -2361,10 +2363,10 @@ class UltraProfessionalIA1TechnicalAnalyst:
                     take_profit_price = ia1_calculated_levels.get('primary_resistance', opportunity.current_price * 1.02)
             else:
                 # Fallback si pas de niveaux calculés - utiliser des pourcentages par défaut
-                if ia1_signal.lower() == "long":
+                if ia1_signal == "long":
                     stop_loss_price = opportunity.current_price * 0.95  # -5% stop loss
                     take_profit_price = opportunity.current_price * 1.10  # +10% take profit
-                elif ia1_signal.lower() == "short":
+                elif ia1_signal == "short":
                     stop_loss_price = opportunity.current_price * 1.05  # +5% stop loss (price increase)
                     take_profit_price = opportunity.current_price * 0.90  # -10% take profit (price decrease)
                 else:  # hold
@@ -2373,14 +2375,14 @@ class UltraProfessionalIA1TechnicalAnalyst:
             
             # 🔧 CALCUL RR BASÉ SUR LES PRIX RÉELS CALCULÉS - FORMULES IA2 EXACTES
             # Utiliser les mêmes formules que IA2 pour cohérence totale
-            if ia1_signal.lower() == "long":
+            if ia1_signal == "long":
                 # LONG: Formule IA2 exacte
                 risk = entry_price - stop_loss_price  # Entry - Stop Loss
                 reward = take_profit_price - entry_price  # Take Profit - Entry
                 ia1_risk_reward_ratio = reward / risk if risk > 0 else 1.0
                 logger.info(f"🔢 LONG RR CALCULATION (IA2 formula) {opportunity.symbol}: Entry({entry_price:.6f}) - SL({stop_loss_price:.6f}) = Risk({risk:.6f}), TP({take_profit_price:.6f}) - Entry = Reward({reward:.6f}), RR = {ia1_risk_reward_ratio:.2f}")
                 
-            elif ia1_signal.lower() == "short":
+            elif ia1_signal == "short":
                 # SHORT: Formule IA2 exacte  
                 risk = stop_loss_price - entry_price  # Stop Loss - Entry
                 reward = entry_price - take_profit_price  # Entry - Take Profit
@@ -3615,8 +3617,10 @@ class UltraProfessionalIA1TechnicalAnalyst:
             Score normalisé -1.0 à +1.0
         """
         try:
+            signal_lower = ia1_signal.lower()  # une seule normalisation pour toutes les branches
+            
             # Neutraliser si signal HOLD ou données manquantes
-            if ia1_signal.lower() == 'hold' or abs(market_cap_change_24h) < 0.1:
+            if signal_lower == 'hold' or abs(market_cap_change_24h) < 0.1:
                 return 0.0
             
             # Facteur d'intensité basé sur l'ampleur de la variation Market Cap
@@ -3624,7 +3628,7 @@ class UltraProfessionalIA1TechnicalAnalyst:
             intensity_factor = min(abs(market_cap_change_24h) / 5.0, 1.0)  # Cap à 5% pour max intensity
             
             # LOGIQUE PRINCIPALE: Alignement signal vs Market Cap momentum
-            if ia1_signal.lower() == 'long':
+            if signal_lower == 'long':
                 # Position LONG
                 if market_cap_change_24h > 0:
                     # Market Cap monte → BONUS pour LONG (avec la tendance)
@@ -3637,7 +3641,7 @@ class UltraProfessionalIA1TechnicalAnalyst:
                     logger.info(f"🔴 LONG + Market Cap {market_cap_change_24h:.2f}% → MALUS {malus_score:+.3f}")
                     return malus_score
                     
-            elif ia1_signal.lower() == 'short':
+            elif signal_lower == 'short':
                 # Position SHORT
                 if market_cap_change_24h < 0:
                     # Market Cap baisse → BONUS pour SHORT (avec la tendance)
@@ -3658,6 +3662,14 @@ class UltraProfessionalIA1TechnicalAnalyst:
             return 0.0
 
 class UltraProfessionalIA2DecisionAgent:
+    # Mots-clés de confirmation des patterns (tuples construits une fois, pas à chaque décision)
+    LIVE_BULLISH_PATTERNS = ("Golden Cross", "Bullish", "Breakout", "Support", "Bounce")
+    LIVE_BEARISH_PATTERNS = ("Death Cross", "Bearish", "Breakdown", "Resistance", "Rejection")
+    PREMIUM_BULLISH_PATTERNS = ("Golden Cross Formation", "Bullish Breakout", "Support Bounce", "Ascending Triangle")
+    PREMIUM_BEARISH_PATTERNS = ("Death Cross Formation", "Bearish Breakdown", "Resistance Rejection", "Descending Triangle")
+    BASIC_BULLISH_PATTERNS = ("Golden Cross", "Bullish", "Breakout", "Support")
+    BASIC_BEARISH_PATTERNS = ("Death Cross", "Bearish", "Breakdown", "Resistance")
+    
     def __init__(self, active_position_manager=None):
         self.chat = get_ia2_chat()
         self.market_aggregator = advanced_market_aggregator
@@ -5086,15 +5098,16 @@ Provide your decision in the EXACT JSON format above with complete market-adapti
         reasoning = f"Perfect chartist pattern detected ({dominant_pattern}). Technical setup takes priority over other signals."
         
         # Logique basée sur le type de pattern
-        if dominant_pattern and "bullish" in dominant_pattern.lower():
+        pattern_lower = dominant_pattern.lower() if dominant_pattern else ""
+        if "bullish" in pattern_lower:
             signal = SignalType.LONG
             confidence = 0.88
             reasoning += " Bullish pattern formation suggests upward momentum."
-        elif dominant_pattern and "bearish" in dominant_pattern.lower():
+        elif "bearish" in pattern_lower:
             signal = SignalType.SHORT
             confidence = 0.88
             reasoning += " Bearish pattern formation suggests downward momentum."
-        elif dominant_pattern and ("breakout" in dominant_pattern.lower() or "golden_cross" in dominant_pattern.lower()):
+        elif "breakout" in pattern_lower or "golden_cross" in pattern_lower:
             signal = SignalType.LONG
             confidence = 0.85
             reasoning += " Breakout pattern indicates bullish continuation."
@@ -5475,15 +5488,12 @@ Provide your decision in the EXACT JSON format above with complete market-adapti
             reasoning += "Low volume - risky for live trading. "
         
         # Pattern confirmation
-        bullish_patterns = ["Golden Cross", "Bullish", "Breakout", "Support", "Bounce"]
-        bearish_patterns = ["Death Cross", "Bearish", "Breakdown", "Resistance", "Rejection"]
-        
         for pattern in analysis.patterns_detected:
-            if any(bp in pattern for bp in bullish_patterns):
+            if any(bp in pattern for bp in self.LIVE_BULLISH_PATTERNS):
                 bullish_signals += 2
                 signal_strength += 0.15
                 reasoning += f"Bullish pattern confirmed: {pattern}. "
-            elif any(bp in pattern for bp in bearish_patterns):
+            elif any(bp in pattern for bp in self.LIVE_BEARISH_PATTERNS):
                 bearish_signals += 2
                 signal_strength += 0.15
                 reasoning += f"Bearish pattern confirmed: {pattern}. "
@@ -6208,15 +6218,12 @@ Provide your decision in the EXACT JSON format above with complete market-adapti
             reasoning += "Low volume - risky for advanced strategies. "
         
         # Advanced pattern confirmation
-        premium_bullish_patterns = ["Golden Cross Formation", "Bullish Breakout", "Support Bounce", "Ascending Triangle"]
-        premium_bearish_patterns = ["Death Cross Formation", "Bearish Breakdown", "Resistance Rejection", "Descending Triangle"]
-        
         for pattern in analysis.patterns_detected:
-            if any(bp in pattern for bp in premium_bullish_patterns):
+            if any(bp in pattern for bp in self.PREMIUM_BULLISH_PATTERNS):
                 bullish_signals += 3
                 signal_strength += 0.25
                 reasoning += f"Premium bullish pattern: {pattern}. "
-            elif any(bp in pattern for bp in premium_bearish_patterns):
+            elif any(bp in pattern for bp in self.PREMIUM_BEARISH_PATTERNS):
                 bearish_signals += 3
                 signal_strength += 0.25
                 reasoning += f"Premium bearish pattern: {pattern}. "
@@ -6869,14 +6876,11 @@ Provide your decision in the EXACT JSON format above with complete market-adapti
             reasoning += "Large cap stability. "
         
         # Pattern analysis bonus
-        bullish_patterns = ["Golden Cross", "Bullish", "Breakout", "Support"]
-        bearish_patterns = ["Death Cross", "Bearish", "Breakdown", "Resistance"]
-        
         for pattern in analysis.patterns_detected:
-            if any(bp in pattern for bp in bullish_patterns):
+            if any(bp in pattern for bp in self.BASIC_BULLISH_PATTERNS):
                 bullish_signals += 1
                 signal_strength += 0.1
-            elif any(bp in pattern for bp in bearish_patterns):
+            elif any(bp in pattern for bp in self.BASIC_BEARISH_PATTERNS):
                 bearish_signals += 1
                 signal_strength += 0.1
         
@@ -7014,6 +7018,7 @@ class UltraProfessionalTradingOrchestrator:
         self.ia2 = UltraProfessionalIA2DecisionAgent(self.active_position_manager)
         self.advanced_strategy_manager = advanced_strategy_manager
         self.is_running = False
+        self.stop_event = asyncio.Event()  # Réveille la boucle de trading dès l'arrêt, sans attendre la fin du sleep
         self.cycle_count = 0
         self._initialized = False
         
@@ -7085,23 +7090,21 @@ class UltraProfessionalTradingOrchestrator:
     async def _get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
         """Get current prices for specified symbols"""
         try:
-            current_prices = {}
-            
-            for symbol in symbols:
-                # Use market aggregator to get current price
-                try:
-                    # Remove USDT suffix for API calls if present
-                    clean_symbol = symbol.replace('USDT', '').upper()
-                    
-                    # Get price from market aggregator
-                    response = await self.scout.market_aggregator.get_comprehensive_market_data(clean_symbol)
-                    if response and response.current_price:
-                        current_prices[symbol] = response.current_price
-                        logger.debug(f"💰 {symbol}: ${response.current_price:.6f}")
-                    
-                except Exception as e:
-                    logger.warning(f"❌ Failed to get price for {symbol}: {e}")
-                    continue
+            # Prix encore frais (ticks BingX live ou fetch récent) lus en une passe, sans toucher aux APIs
+            cached_prices = ultra_robust_aggregator.get_cached_prices(symbols)
+            current_prices = {symbol: price for symbol, price in cached_prices.items() if price}
+            missing = [symbol for symbol in symbols if symbol not in current_prices]
+            
+            # Fetch the remaining symbols concurrently (cache-first, one upstream call per symbol)
+            responses = await ultra_robust_aggregator.get_ultra_robust_batch_price_data(missing) if missing else {}
+            
+            for symbol in missing:
+                response = responses.get(symbol)
+                if response and response.price:
+                    current_prices[symbol] = response.price
+                    logger.debug(f"💰 {symbol}: ${response.price:.6f}")
+                else:
+                    logger.warning(f"❌ Failed to get price for {symbol}")
             
             return current_prices
             
@@ -7121,12 +7124,13 @@ class UltraProfessionalTradingOrchestrator:
             
             # Start main trading system
             self.is_running = True
+            stop_event = self.stop_event = asyncio.Event()  # Nouvel événement par démarrage: une ancienne boucle ne peut pas repartir
             
             # Start trailing stop monitor
             await self.start_trailing_stop_monitor()
             
             # Start main trading loop in background
-            asyncio.create_task(ultra_professional_trading_loop())
+            asyncio.create_task(ultra_professional_trading_loop(stop_event))
             
             logger.info("🚀 Ultra Professional Trading System started with trailing stops!")
             return {"status": "started", "message": "Ultra Professional Trading System activated with trailing stop monitoring"}
@@ -7144,6 +7148,7 @@ class UltraProfessionalTradingOrchestrator:
         try:
             # Stop main trading system
             self.is_running = False
+            self.stop_event.set()
             
             # Stop trailing stop monitor
             await self.stop_trailing_stop_monitor()
@@ -7330,25 +7335,39 @@ class UltraProfessionalTradingOrchestrator:
                 return 0
             
             # 🎯 NOUVEAU: Stocker les opportunités IMMÉDIATEMENT (avant analyse IA1)
+            # Déduplication en une requête ($in) puis insertion groupée (insert_many)
             opportunities_stored_immediate = 0
-            for opportunity in opportunities:
+            try:
+                recent_cutoff = get_paris_time() - timedelta(hours=2)  # 2h pour plus de fraîcheur
+                already_stored = set(await db.market_opportunities.distinct("symbol", {
+                    "symbol": {"$in": [opp.symbol for opp in opportunities]},
+                    "timestamp": {"$gte": recent_cutoff}
+                }))
+            except Exception as e:
+                logger.error(f"❌ Failed to check recent opportunities: {e}")
+                already_stored = None
+            
+            to_store = []
+            if already_stored is not None:
+                for opportunity in opportunities:
+                    if opportunity.symbol in already_stored:
+                        logger.debug(f"🔄 SKIP DUPLICATE: {opportunity.symbol} already stored recently")
+                        continue
+                    already_stored.add(opportunity.symbol)
+                    to_store.append(opportunity)
+            
+            if to_store:
                 try:
-                    # Vérifier si cette opportunité existe déjà (déduplication)
-                    recent_cutoff = get_paris_time() - timedelta(hours=2)  # 2h pour plus de fraîcheur
-                    existing = await db.market_opportunities.find_one({
-                        "symbol": opportunity.symbol,
-                        "timestamp": {"$gte": recent_cutoff}
-                    })
-                    
-                    if not existing:
-                        await db.market_opportunities.insert_one(opportunity.dict())
-                        opportunities_stored_immediate += 1
+                    result = await db.market_opportunities.insert_many(
+                        [opportunity.dict() for opportunity in to_store], ordered=False
+                    )
+                    opportunities_stored_immediate = len(result.inserted_ids)
+                    for opportunity in to_store:
                         logger.info(f"📁 IMMEDIATE STORE: {opportunity.symbol} - ${opportunity.current_price:.4f} ({opportunity.price_change_24h:+.2f}%)")
-                    else:
-                        logger.debug(f"🔄 SKIP DUPLICATE: {opportunity.symbol} already stored recently")
-                        
                 except Exception as e:
-                    logger.error(f"❌ Failed to store opportunity {opportunity.symbol}: {e}")
+                    # BulkWriteError (ordered=False) : les documents valides sont tout de même insérés
+                    opportunities_stored_immediate = (getattr(e, "details", None) or {}).get("nInserted", 0)
+                    logger.error(f"❌ Failed to store opportunities batch: {e}")
             
             logger.info(f"📊 STORED {opportunities_stored_immediate}/{len(opportunities)} opportunities immediately")
 
@@ -7370,17 +7389,24 @@ class UltraProfessionalTradingOrchestrator:
             analysis_tasks = []
             analyzed_opportunities = []  # Track which opportunities were actually analyzed
             
+            # NOUVEAU: VÉRIFICATION DÉDUPLICATION AVANT ANALYSE IA1 (économie crédits LLM)
+            # Une seule requête pour tout le top 10 au lieu d'un find_one par symbol
+            recent_cutoff = get_paris_time() - timedelta(hours=4)
+            candidate_symbols = [opp.symbol for opp in top_opportunities]
+            try:
+                recently_analyzed_symbols = set(await db.technical_analyses.distinct("symbol", {
+                    "symbol": {"$in": candidate_symbols},
+                    "timestamp": {"$gte": recent_cutoff}
+                }))
+            except Exception as e:
+                # Échec de la vérification: aucun symbole analysé plutôt que des doublons (même politique que le stockage immédiat)
+                logger.error(f"❌ Failed to check recent IA1 analyses: {e}")
+                recently_analyzed_symbols = set(candidate_symbols)
+            
             for opportunity in top_opportunities:
-                # NOUVEAU: VÉRIFICATION DÉDUPLICATION AVANT ANALYSE IA1 (économie crédits LLM)
                 symbol = opportunity.symbol
-                recent_cutoff = get_paris_time() - timedelta(hours=4)
                 
-                existing_recent_analysis = await db.technical_analyses.find_one({
-                    "symbol": symbol,
-                    "timestamp": {"$gte": recent_cutoff}
-                })
-                
-                if existing_recent_analysis:
+                if symbol in recently_analyzed_symbols:
                     ia1_analyses_deduplicated += 1
                     logger.info(f"🔄 IA1 PRE-FILTER SKIP: {symbol} - Recent analysis exists, SKIPPING IA1 (saving LLM credits)")
                     continue  # Skip IA1 analysis completely
@@ -7466,6 +7492,20 @@ class UltraProfessionalTradingOrchestrator:
             opportunities_stored = 0
             opportunities_deduplicated = 0
             
+            # Chercher des opportunités récentes (dernier cycle 4h) pour éviter les doublons - une requête pour tous les symbols
+            recent_cutoff = get_paris_time() - timedelta(hours=4)
+            candidate_symbols = [item[0].symbol for item in valid_analyses
+                                 if isinstance(item, (list, tuple)) and len(item) == 2 and item[0] is not None]
+            try:
+                recent_opportunity_symbols = set(await db.market_opportunities.distinct("symbol", {
+                    "symbol": {"$in": candidate_symbols},
+                    "timestamp": {"$gte": recent_cutoff}
+                }))
+            except Exception as e:
+                # Échec de la vérification: rien n'est stocké plutôt que des doublons
+                logger.error(f"❌ Failed to check recent opportunities: {e}")
+                recent_opportunity_symbols = set(candidate_symbols)
+            
             for item in valid_analyses:
                 try:
                     # 🛡️ SÉCURITÉ: Vérification structure tuple avant unpacking
@@ -7482,23 +7522,15 @@ class UltraProfessionalTradingOrchestrator:
                     
                     # NOUVEAU: Vérification de déduplication avant stockage
                     symbol = opportunity.symbol
-                    current_time = get_paris_time()
-                    
-                    # Chercher des opportunités récentes (dernier cycle 4h) pour éviter les doublons
-                    recent_cutoff = get_paris_time() - timedelta(hours=4)
-                    
-                    existing_recent = await db.market_opportunities.find_one({
-                        "symbol": symbol,
-                        "timestamp": {"$gte": recent_cutoff}
-                    })
                     
-                    if existing_recent:
+                    if symbol in recent_opportunity_symbols:
                         opportunities_deduplicated += 1
                         logger.debug(f"🔄 DEDUPLICATED: {symbol} - Recent opportunity exists (avoiding IA2 duplicate processing)")
                         continue
                     
                     # Stocker uniquement si pas de doublon récent
                     await db.market_opportunities.insert_one(opportunity.dict())
+                    recent_opportunity_symbols.add(symbol)
                     opportunities_stored += 1
                     logger.debug(f"📁 Stored opportunity: {opportunity.symbol}")
                 except Exception as e:
@@ -7565,6 +7597,19 @@ class UltraProfessionalTradingOrchestrator:
                 try:
                     decisions = await asyncio.gather(*decision_tasks, return_exceptions=True)
                     
+                    # Déduplication IA2 (cohérence 4h avec Scout et IA1): une requête pour toutes les décisions du cycle
+                    recent_cutoff = get_paris_time() - timedelta(hours=4)
+                    candidate_symbols = [analysis.symbol for _, analysis in decisions_to_make]
+                    try:
+                        recent_decision_symbols = set(await db.trading_decisions.distinct("symbol", {
+                            "symbol": {"$in": candidate_symbols},
+                            "timestamp": {"$gte": recent_cutoff}
+                        }))
+                    except Exception as e:
+                        # Échec de la vérification: aucune décision stockée plutôt que des doublons
+                        logger.error(f"❌ Failed to check recent IA2 decisions: {e}")
+                        recent_decision_symbols = set(candidate_symbols)
+                    
                     # Process decision results
                     for i, decision in enumerate(decisions):
                         # 🚀 NOUVELLE LOGIQUE ADAPTATIVE: Appliquer contexte après IA2
@@ -7576,20 +7621,15 @@ class UltraProfessionalTradingOrchestrator:
                         if isinstance(decision, TradingDecision) and decision.signal != "HOLD":
                             # NOUVEAU: Vérification de déduplication IA2 avant stockage (cohérence 4h)
                             symbol = decision.symbol
-                            recent_cutoff = get_paris_time() - timedelta(hours=4)  # Cohérent avec Scout et IA1
-                            
-                            existing_recent_decision = await db.trading_decisions.find_one({
-                                "symbol": symbol,
-                                "timestamp": {"$gte": recent_cutoff}
-                            })
                             
-                            if existing_recent_decision:
+                            if symbol in recent_decision_symbols:
                                 ia2_decisions_deduplicated += 1
                                 logger.info(f"🔄 IA2 DECISION DEDUPLICATED: {symbol} - Recent decision exists (avoiding duplicate IA2 processing)")
                                 continue  # Skip storing this duplicate decision
                             
                             # Store decision seulement si pas de doublon récent
                             await db.trading_decisions.insert_one(decision.dict())
+                            recent_decision_symbols.add(symbol)
                             decisions_made += 1
                             logger.info(f"📁 IA2 DECISION STORED: {symbol} (no recent duplicates)")
                             
@@ -7753,9 +7793,53 @@ async def get_analyses_simple():
     except Exception as e:
         return {"error": str(e), "analyses": []}
 
+# Champs numériques des analyses IA1 -> valeur de remplacement si invalide
+ANALYSIS_NUMERIC_DEFAULTS = {
+    'rsi': 50.0,
+    'macd_signal': 0.0,
+    'bollinger_position': 0.0,
+    'fibonacci_level': 0.618,
+    'analysis_confidence': 0.5,
+}
+
+def _numeric_sanitizer(default: float):
+    """Garde la vraie valeur IA1, remplace seulement les valeurs invalides par le défaut du champ"""
+    def sanitize(val):
+        return default if (val is None or pd.isna(val) or abs(val) > 1e6) else float(val)
+    return sanitize
+
+def _sanitize_levels(levels):
+    """Listes support/resistance: valeurs invalides retirées, max 5 niveaux"""
+    if not isinstance(levels, list):
+        return []
+    clean_list = []
+    for val in levels:
+        try:
+            if pd.notna(val) and abs(float(val)) < 1e6:
+                clean_list.append(float(val))
+        except:
+            pass
+    return clean_list[:5]
+
+def _sanitize_text(val):
+    return str(val) if val is not None else ""
+
+# Champ -> fonction de validation, choisie une fois à l'import (pas de dispatch par type à chaque analyse)
+ANALYSIS_FIELD_SANITIZERS = {
+    **{field: _numeric_sanitizer(default) for field, default in ANALYSIS_NUMERIC_DEFAULTS.items()},
+    'support_levels': _sanitize_levels,
+    'resistance_levels': _sanitize_levels,
+    'ia1_reasoning': _sanitize_text,
+    'market_sentiment': _sanitize_text,
+}
+
 @api_router.get("/analyses")
-async def get_analyses():
-    """Get recent technical analyses - VRAIES valeurs IA1 avec validation JSON et déduplication"""
+async def get_analyses(limit: int = 10):
+    """Get recent technical analyses - VRAIES valeurs IA1 avec validation JSON et déduplication
+    
+    ?limit=1 ne valide/sérialise que l'analyse la plus récente (max 10)
+    """
+    limit = max(1, min(limit, 10))
     try:
         # Récupérer toutes les analyses récentes (avec plus de limite pour déduplication)
         all_analyses = await db.technical_analyses.find().sort("timestamp", -1).limit(50).to_list(50)
@@ -7786,10 +7870,10 @@ async def get_analyses():
                         analysis['parsed_timestamp'] = analysis_time  # Pour comparaison
                         deduplicated_analyses[symbol] = analysis
         
-        # Convertir le dict en liste et prendre les 10 plus récentes
+        # Convertir le dict en liste et prendre les `limit` plus récentes
         real_analyses = list(deduplicated_analyses.values())
         real_analyses.sort(key=lambda x: x.get('parsed_timestamp', datetime.min.replace(tzinfo=PARIS_TZ)), reverse=True)
-        real_analyses = real_analyses[:10]  # Limiter à 10
+        real_analyses = real_analyses[:limit]  # Limiter à 10 par défaut
         
         if not real_analyses:
             return {"analyses": [], "ultra_professional": True, "note": "No analyses found"}
@@ -7811,46 +7895,10 @@ async def get_analyses():
                 elif 'timestamp' in analysis:
                     analysis['timestamp'] = str(analysis['timestamp'])
                 
-                # Validation sécurisée des valeurs numériques (garder les vraies valeurs IA1)
-                numeric_fields = ['rsi', 'macd_signal', 'bollinger_position', 'fibonacci_level', 'analysis_confidence']
-                for field in numeric_fields:
+                # Validation sécurisée: numériques, niveaux support/resistance et strings en une passe
+                for field, sanitize in ANALYSIS_FIELD_SANITIZERS.items():
                     if field in analysis:
-                        val = analysis[field]
-                        if val is None or pd.isna(val) or not pd.notna(val) or abs(val) > 1e6:
-                            # Remplace seulement les valeurs invalides, garde les vraies valeurs IA1
-                            if field == 'rsi':
-                                analysis[field] = 50.0
-                            elif field == 'analysis_confidence':
-                                analysis[field] = 0.5
-                            elif field == 'fibonacci_level':
-                                analysis[field] = 0.618
-                            else:
-                                analysis[field] = 0.0
-                        else:
-                            # Garde les vraies valeurs IA1 calculées
-                            analysis[field] = float(val)
-                
-                # Valide les listes (support/resistance)
-                for list_field in ['support_levels', 'resistance_levels']:
-                    if list_field in analysis:
-                        if not isinstance(analysis[list_field], list):
-                            analysis[list_field] = []
-                        else:
-                            # Nettoie les valeurs invalides dans les listes
-                            clean_list = []
-                            for val in analysis[list_field]:
-                                try:
-                                    if pd.notna(val) and abs(float(val)) < 1e6:
-                                        clean_list.append(float(val))
-                                except:
-                                    pass
-                            analysis[list_field] = clean_list[:5]  # Max 5 niveaux
-                
-                # Valide les strings
-                string_fields = ['ia1_reasoning', 'market_sentiment']
-                for field in string_fields:
-                    if field in analysis:
-                        analysis[field] = str(analysis[field]) if analysis[field] is not None else ""
+                        analysis[field] = sanitize(analysis[field])
                 
                 # Valide patterns_detected
                 if 'patterns_detected' not in analysis or not isinstance(analysis['patterns_detected'], list):
@@ -7901,6 +7949,7 @@ async def get_market_aggregator_stats():
         stats = advanced_market_aggregator.get_performance_stats()
         return {
             "aggregator_stats": stats,
+            "ultra_robust_cache": ultra_robust_aggregator.get_cache_stats(),
             "ultra_professional": True,
             "timestamp": get_paris_time().strftime('%Y-%m-%d %H:%M:%S') + " (Heure de Paris)"
         }
@@ -7932,16 +7981,41 @@ async def clear_decisions():
 async def get_performance():
     """Get ultra professional trading performance metrics"""
     try:
-        decisions = await db.trading_decisions.find().to_list(200)
-        opportunities = await db.market_opportunities.find().to_list(200)
-        analyses = await db.technical_analyses.find().to_list(200)
+        # Projections : seuls les champs utilisés par les métriques sont décodés
+        # Les trois lectures sont indépendantes : exécutées en parallèle
+        decisions, opportunities, analyses = await asyncio.gather(
+            db.trading_decisions.find(
+                {}, {"_id": 0, "status": 1, "signal": 1, "confidence": 1}
+            ).to_list(200),
+            db.market_opportunities.find(
+                {}, {"_id": 0, "data_sources": 1, "data_confidence": 1}
+            ).to_list(200),
+            db.technical_analyses.find({}, {"_id": 1}).to_list(200)
+        )
         
-        total_trades = len([d for d in decisions if d.get('status') == 'executed'])
-        profitable_trades = len([d for d in decisions if d.get('status') == 'executed' and d.get('signal') != 'hold'])
+        # Un seul passage par collection pour toutes les métriques
+        total_trades = profitable_trades = high_confidence_decisions = 0
+        confidence_sum = 0
+        for d in decisions:
+            confidence = d.get('confidence', 0)
+            confidence_sum += confidence
+            if confidence > 0.8:
+                high_confidence_decisions += 1
+            if d.get('status') == 'executed':
+                total_trades += 1
+                if d.get('signal') != 'hold':
+                    profitable_trades += 1
         
         # Enhanced performance metrics
-        high_confidence_decisions = len([d for d in decisions if d.get('confidence', 0) > 0.8])
-        multi_source_opportunities = len([o for o in opportunities if len(o.get('data_sources', [])) > 1])
+        multi_source_opportunities = 0
+        data_confidence_sum = 0
+        data_sources_seen = set()
+        for o in opportunities:
+            sources = o.get('data_sources', [])
+            if len(sources) > 1:
+                multi_source_opportunities += 1
+            data_sources_seen.update(sources)
+            data_confidence_sum += o.get('data_confidence', 0)
         
         performance = {
             "total_opportunities": len(opportunities),
@@ -7951,9 +8025,9 @@ async def get_performance():
             "executed_trades": total_trades,
             "high_confidence_decisions": high_confidence_decisions,
             "win_rate": (profitable_trades / total_trades * 100) if total_trades > 0 else 0,
-            "avg_confidence": sum([d.get('confidence', 0) for d in decisions]) / len(decisions) if decisions else 0,
-            "avg_data_confidence": sum([o.get('data_confidence', 0) for o in opportunities]) / len(opportunities) if opportunities else 0,
-            "data_source_diversity": len(set([src for opp in opportunities for src in opp.get('data_sources', [])])),
+            "avg_confidence": confidence_sum / len(decisions) if decisions else 0,
+            "avg_data_confidence": data_confidence_sum / len(opportunities) if opportunities else 0,
+            "data_source_diversity": len(data_sources_seen),
             "ultra_professional": True,
             "version": "3.0.0",
             "last_update": get_paris_time().strftime('%Y-%m-%d %H:%M:%S') + " (Heure de Paris)"
@@ -8046,7 +8120,8 @@ async def get_live_trading_performance():
     try:
         # Get decisions with BingX integration
         decisions = await db.trading_decisions.find(
-            {"bingx_order_id": {"$exists": True}}
+            {"bingx_order_id": {"$exists": True}},
+            {"_id": 0, "bingx_order_id": 1, "bingx_status": 1}
         ).sort("timestamp", -1).limit(100).to_list(100)
         
         # Calculate live trading stats
@@ -8273,8 +8348,10 @@ async def get_system_timing_info():
 async def get_scout_info():
     """Get detailed scout information and statistics"""
     try:
-        # Get recent opportunities to see scout activity
-        recent_opportunities = await db.market_opportunities.find().sort("timestamp", -1).limit(10).to_list(10)
+        # Get recent opportunities to see scout activity (seul le timestamp est utilisé)
+        recent_opportunities = await db.market_opportunities.find(
+            {}, {"_id": 0, "timestamp": 1}
+        ).sort("timestamp", -1).limit(10).to_list(10)
         
         # Calculate time since last scout activity
         last_opportunity_time = None
@@ -8673,6 +8750,44 @@ async def test_intelligent_ohlcv_system():
             "timestamp": get_paris_time().isoformat()
         }
 
+@api_router.get("/admin/market/price-cache/test")
+async def test_ultra_robust_price_cache():
+    """
+    🎯 ENDPOINT ADMIN: Mesurer le cache prix ultra-robust (fetch à froid vs lecture cache)
+    """
+    try:
+        test_symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"]
+        
+        # 1. Baseline à froid: invalider uniquement les symboles testés, puis fetch concurrent
+        ultra_robust_aggregator.invalidate_symbols(test_symbols)
+        start = time.perf_counter()
+        cold_results = await ultra_robust_aggregator.get_ultra_robust_batch_price_data(test_symbols)
+        cold_time = time.perf_counter() - start
+        
+        # 2. Même batch servi par le cache
+        start = time.perf_counter()
+        warm_results = await ultra_robust_aggregator.get_ultra_robust_batch_price_data(test_symbols)
+        warm_time = time.perf_counter() - start
+        
+        return {
+            "status": "success",
+            "test_timestamp": get_paris_time().isoformat(),
+            "test_symbols": test_symbols,
+            "cold_fetch_ms": round(cold_time * 1000, 2),
+            "cached_fetch_ms": round(warm_time * 1000, 2),
+            "speedup": round(cold_time / max(warm_time, 1e-9), 1),
+            "symbols_fetched": sum(1 for r in cold_results.values() if r),
+            "symbols_cached": sum(1 for r in warm_results.values() if r)
+        }
+        
+    except Exception as e:
+        logger.error(f"❌ Error testing ultra-robust price cache: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": get_paris_time().isoformat()
+        }
+
 @api_router.get("/admin/market/critical")
 async def get_critical_market_variables():
     """
@@ -9124,7 +9239,7 @@ async def get_ai_training_status():
     """Obtient le statut du système d'entraînement IA (version optimisée)"""
     try:
         # Use optimized version for quick response
-        status_data = await ai_training_optimizer.get_quick_training_status()
+        status_data = ai_training_optimizer.get_quick_training_status()
         
         return {
             'success': True,
@@ -10269,19 +10384,17 @@ async def deep_scan_bingx_futures():
                 results["all_swap_methods"] = swap_methods_available
                 logger.info(f"Available swap methods: {swap_methods_available}")
                 
-                # Try balance-related methods
-                balance_keywords = ['balance', 'account', 'wallet', 'margin', 'equity']
-                potential_methods = []
-                
-                for method in swap_methods_available:
-                    if any(keyword in method.lower() for keyword in balance_keywords):
-                        potential_methods.append(method)
+                # Try balance-related methods (une seule regex compilée, pas de .lower() par mot-clé)
+                import re
+                balance_keywords_re = re.compile(r"balance|account|wallet|margin|equity", re.IGNORECASE)
+                potential_methods = [method for method in swap_methods_available if balance_keywords_re.search(method)]
                 
                 results["potential_balance_methods"] = potential_methods
                 
                 # Test these potential methods
+                already_tested = {m["method"].split(".")[-1] for m in results["methods_tested"]}
                 for method_name in potential_methods:
-                    if method_name not in [m["method"].split(".")[-1] for m in results["methods_tested"]]:
+                    if method_name not in already_tested:
                         try:
                             method = getattr(client.swap, method_name)
                             
@@ -10433,16 +10546,9 @@ async def check_our_ip():
                     "error": error_msg
                 }
         
-        # Find the most common IP
-        ip_counts = {}
-        for ip_data in ips_found:
-            ip = ip_data['ip']
-            if ip in ip_counts:
-                ip_counts[ip] += 1
-            else:
-                ip_counts[ip] = 1
-        
-        most_common_ip = max(ip_counts.keys(), key=ip_counts.get) if ip_counts else None
+        # Find the most common IP (comptage en C via Counter)
+        ip_counts = Counter(ip_data['ip'] for ip_data in ips_found)
+        most_common_ip = ip_counts.most_common(1)[0][0] if ip_counts else None
         
         return {
             "our_detected_ips": ips_found,
@@ -11246,16 +11352,9 @@ async def check_our_ip():
                     "error": error_msg
                 }
         
-        # Find the most common IP
-        ip_counts = {}
-        for ip_data in ips_found:
-            ip = ip_data['ip']
-            if ip in ip_counts:
-                ip_counts[ip] += 1
-            else:
-                ip_counts[ip] = 1
-        
-        most_common_ip = max(ip_counts.keys(), key=ip_counts.get) if ip_counts else None
+        # Find the most common IP (comptage en C via Counter)
+        ip_counts = Counter(ip_data['ip'] for ip_data in ips_found)
+        most_common_ip = ip_counts.most_common(1)[0][0] if ip_counts else None
         
         return {
             "our_detected_ips": ips_found,
@@ -11290,19 +11389,27 @@ async def websocket_endpoint(websocket: WebSocket):
         manager.disconnect(websocket)
 
 # Ultra professional background trading loop with trending auto-update
-async def ultra_professional_trading_loop():
-    """Ultra professional continuous trading loop with trending auto-update"""
+async def ultra_professional_trading_loop(stop_event: asyncio.Event):
+    """Ultra professional continuous trading loop with trending auto-update
+    stop_event: événement du démarrage qui a créé cette boucle (un restart en crée un nouveau)"""
     # Initialize the orchestrator
     await orchestrator.initialize()
     
-    while orchestrator.is_running:
+    async def wait_or_stop(seconds: float):
+        """Sleep between cycles, waking immediately when the system is stopped"""
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    while orchestrator.is_running and not stop_event.is_set():
         try:
             # 🚨 CIRCUIT BREAKER - Vérifier CPU avant démarrage du cycle
             import psutil
             cpu_usage = psutil.cpu_percent(interval=1)
             if cpu_usage > 80.0:
                 logger.warning(f"🚨 HIGH CPU DETECTED ({cpu_usage:.1f}%) - Skipping cycle to prevent overload")
-                await asyncio.sleep(300)  # Wait 5 minutes
+                await wait_or_stop(300)  # Wait 5 minutes
                 continue
             
             cycle_start = datetime.now()
@@ -11328,11 +11435,11 @@ async def ultra_professional_trading_loop():
             })
             
             # Ultra professional cycle timing - every 4 hours for comprehensive analysis
-            await asyncio.sleep(14400)  # 4 heures = 14400 secondes
+            await wait_or_stop(14400)  # 4 heures = 14400 secondes
             
         except Exception as e:
             logger.error(f"Ultra professional trending trading loop error: {e}")
-            await asyncio.sleep(120)  # Wait 2 minutes on error
+            await wait_or_stop(120)  # Wait 2 minutes on error
 
 # WebSocket endpoint for real-time updates
 @app.websocket("/api/ws")
@@ -11356,10 +11463,10 @@ async def websocket_endpoint(websocket: WebSocket):
                 # Send periodic updates every 30 seconds
                 await asyncio.sleep(30)
                 
-                # Get current system status
-                opportunities_count = await db.market_opportunities.count_documents({})
-                analyses_count = await db.technical_analyses.count_documents({})
-                decisions_count = await db.trading_decisions.count_documents({})
+                # Get current system status (métadonnées de collection, O(1) sans filtre)
+                opportunities_count = await db.market_opportunities.estimated_document_count()
+                analyses_count = await db.technical_analyses.estimated_document_count()
+                decisions_count = await db.trading_decisions.estimated_document_count()
                 
                 update_data = {
                     "type": "update",
@@ -11407,6 +11514,20 @@ async def startup_event():
     try:
         logger.info("🚀 Application startup - Initializing systems...")
         
+        # Live BingX prices refresh the ultra-robust price cache
+        bingx_manager.add_price_listener(ultra_robust_aggregator.on_price_update)
+
+        # Index (symbol, timestamp) pour les find_one de déduplication Scout/IA1/IA2 (sinon scan de collection)
+        # + index timestamp seul pour les listes "plus récents d'abord" / fenêtres de temps sans symbol
+        try:
+            for collection in (db.market_opportunities, db.technical_analyses, db.trading_decisions):
+                await asyncio.gather(
+                    collection.create_index([("symbol", 1), ("timestamp", -1)]),
+                    collection.create_index([("timestamp", -1)])
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not ensure MongoDB indexes: {e}")
+
         # 🔧 ORCHESTRATOR INIT AVEC PROTECTIONS CPU
         logger.info("🚀 Initializing orchestrator with CPU protections...")
         
@@ -11438,4 +11559,8 @@ async def shutdown_db_client():
     client.close()
     # Shutdown thread pool
     if hasattr(orchestrator.scout.market_aggregator, 'thread_pool'):
-        orchestrator.scout.market_aggregator.thread_pool.shutdown(wait=True)
\ No newline at end of file
+        orchestrator.scout.market_aggregator.thread_pool.shutdown(wait=True)
+    # Close ultra-robust aggregator HTTP session
+    await ultra_robust_aggregator.close()
+    # Close global market analyzer HTTP session
+    await global_crypto_market_analyzer.close()
\ No newline at end of file
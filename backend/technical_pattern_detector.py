@@ -252,7 +252,7 @@ class TechnicalPatternDetector:
     async def _fetch_yahoo_ohlcv(self, symbol: str) -> Optional[pd.DataFrame]:
         """Récupère OHLCV depuis Yahoo Finance"""
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             yf_symbol = symbol.replace('USDT', '-USD')
             
             ticker = await loop.run_in_executor(None, yf.Ticker, yf_symbol)
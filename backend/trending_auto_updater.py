@@ -9,6 +9,21 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Regex compilées une seule fois au chargement du module
+TREND_KEYWORDS_RE = re.compile(r"trend|hot|gainer|mover|top", re.IGNORECASE)  # "trending" couvert par "trend"
+KNOWN_TRENDING_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'World Liberty Financial.*?(\d+)',
+    r'Euler.*?(\d+)',
+    r'Portal to Bitcoin.*?(\d+)',
+    r'PinLink.*?(\d+)',
+    r'Pump\.fun.*?(\d+)',
+    r'Somnia.*?(\d+)'
+)]
+EXCLUDED_SYMBOLS = frozenset({'HTTP', 'HTTPS', 'WWW', 'COM', 'NET', 'ORG', 'HTML', 'API', 'JSON', 'XML'})
+
+# Renvoyé par _fetch_page_content quand la page n'a pas changé depuis le dernier parsing
+PAGE_UNCHANGED = object()
+
 @dataclass
 class TrendingCrypto:
     symbol: str
@@ -33,13 +48,18 @@ class TrendingAutoUpdater:
         self.is_running = False
         self.update_task = None
         
-        # Patterns de détection des cryptos trending
-        self.crypto_patterns = [
+        # Validateurs HTTP + empreinte du dernier contenu parsé (GET conditionnel, pas de re-parsing inutile)
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._content_hash: Optional[int] = None
+        
+        # Patterns de détection des cryptos trending (compilés une fois)
+        self.crypto_patterns = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
             r'([A-Z]{2,10})\s*-?\s*.*?Rank\s*#(\d+)',  # Pattern principal
             r'([A-Z]{2,10})\s*\([^)]+\)\s*.*?#(\d+)',   # Pattern avec parenthèses
             r'([A-Z]{2,10})\s*.*?#(\d+)',               # Pattern simple
             r'([A-Z]{2,10}USDT?)',                      # Pattern direct
-        ]
+        )]
         
         logger.info("TrendingAutoUpdater initialized - 6h update cycle")
     
@@ -106,6 +126,11 @@ class TrendingAutoUpdater:
             # Récupère le contenu de la page
             page_content = await self._fetch_page_content()
             
+            if page_content is PAGE_UNCHANGED:
+                self.last_update = datetime.now(timezone.utc)
+                logger.info(f"♻️ Trending page unchanged - keeping {len(self.current_trending)} cryptos")
+                return self.current_trending
+            
             if not page_content:
                 logger.error("Failed to fetch page content")
                 return []
@@ -116,6 +141,7 @@ class TrendingAutoUpdater:
             if trending_cryptos:
                 self.current_trending = trending_cryptos
                 self.last_update = datetime.now(timezone.utc)
+                self._content_hash = hash(page_content)
                 
                 symbols = [crypto.symbol for crypto in trending_cryptos]
                 logger.info(f"✅ Updated trending list: {symbols}")
@@ -133,8 +159,11 @@ class TrendingAutoUpdater:
             logger.error(f"Error updating trending list: {e}")
             return []
     
-    async def _fetch_page_content(self) -> Optional[str]:
-        """Récupère le contenu de la page Readdy avec timeout strict"""
+    async def _fetch_page_content(self):
+        """Récupère le contenu de la page Readdy avec timeout strict
+        
+        Retourne PAGE_UNCHANGED si la page est identique à la dernière version parsée (304 ou même contenu)
+        """
         try:
             # 🚨 TIMEOUT STRICT pour éviter les blocages
             timeout = aiohttp.ClientTimeout(total=10, connect=5)  # Timeout réduit à 10s
@@ -142,11 +171,23 @@ class TrendingAutoUpdater:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (compatible; TradingBot/3.0; +https://trading-bot.ai)'
                 }
+                # GET conditionnel seulement si on a une liste issue de cette version de la page
+                if self.current_trending:
+                    if self._etag:
+                        headers['If-None-Match'] = self._etag
+                    if self._last_modified:
+                        headers['If-Modified-Since'] = self._last_modified
                 
                 logger.info(f"📡 Fetching trending data from {self.trending_url} (timeout: 10s)")
                 async with session.get(self.trending_url, headers=headers) as response:
+                    if response.status == 304 and self.current_trending:
+                        return PAGE_UNCHANGED
                     if response.status == 200:
+                        self._etag = response.headers.get('ETag')
+                        self._last_modified = response.headers.get('Last-Modified')
                         content = await response.text()
+                        if self.current_trending and hash(content) == self._content_hash:
+                            return PAGE_UNCHANGED  # Serveur sans validateurs: même contenu, inutile de re-parser
                         logger.info(f"✅ Successfully fetched page content ({len(content)} chars)")
                         return content
                     else:
@@ -183,7 +224,7 @@ class TrendingAutoUpdater:
                 
                 # Pattern matching pour les cryptos
                 for pattern in self.crypto_patterns:
-                    matches = re.finditer(pattern, section, re.IGNORECASE | re.MULTILINE)
+                    matches = pattern.finditer(section)
                     
                     for match in matches:
                         try:
@@ -227,20 +268,15 @@ class TrendingAutoUpdater:
     def _extract_trends_section(self, content: str) -> Optional[str]:
         """Extrait la section trends de la page"""
         try:
-            # Recherche de mots-clés pour identifier la section trends
-            trend_keywords = ["trend", "trending", "hot", "gainer", "mover", "top"]
+            # Recherche de mots-clés pour identifier la section trends : un seul balayage regex,
+            # la première correspondance donne la première ligne contenant un mot-clé
+            match = TREND_KEYWORDS_RE.search(content)
+            if not match:
+                return None
             
             lines = content.split('\n')
-            trends_section = []
-            in_trends = False
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower()
-                
-                if any(keyword in line_lower for keyword in trend_keywords):
-                    in_trends = True
-                    trends_section = lines[max(0, i-5):min(len(lines), i+20)]
-                    break
+            i = content.count('\n', 0, match.start())
+            trends_section = lines[max(0, i-5):min(len(lines), i+20)]
             
             return '\n'.join(trends_section) if trends_section else None
             
@@ -251,9 +287,10 @@ class TrendingAutoUpdater:
     def _extract_bottom_section(self, content: str) -> Optional[str]:
         """Extrait la section du bas de la page (où sont souvent les trends)"""
         try:
-            lines = content.split('\n')
+            # Découpe seulement la fin de la page (comme un tail) au lieu de toute la page
+            lines = content.rsplit('\n', 50)[-50:]
             # Prend les 30 dernières lignes significatives
-            bottom_lines = [line for line in lines[-50:] if line.strip()]
+            bottom_lines = [line for line in lines if line.strip()]
             return '\n'.join(bottom_lines[-30:])
         except:
             return None
@@ -262,16 +299,6 @@ class TrendingAutoUpdater:
         """Extrait les patterns spécifiques connus de votre page"""
         known_cryptos = []
         
-        # Patterns spécifiques observés dans votre page
-        specific_patterns = [
-            r'World Liberty Financial.*?(\d+)',
-            r'Euler.*?(\d+)', 
-            r'Portal to Bitcoin.*?(\d+)',
-            r'PinLink.*?(\d+)',
-            r'Pump\.fun.*?(\d+)',
-            r'Somnia.*?(\d+)'
-        ]
-        
         symbol_mapping = {
             'World Liberty Financial': 'WLFI',
             'Euler': 'EUL',
@@ -281,8 +308,9 @@ class TrendingAutoUpdater:
             'Somnia': 'SOMI'
         }
         
-        for pattern in specific_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        # Patterns spécifiques observés dans votre page
+        for pattern in KNOWN_TRENDING_PATTERNS:
+            matches = pattern.finditer(content)
             for match in matches:
                 try:
                     name = match.group(0).split('.')[0].strip()
@@ -308,8 +336,7 @@ class TrendingAutoUpdater:
             return False
         
         # Exclusions
-        excluded = ['HTTP', 'HTTPS', 'WWW', 'COM', 'NET', 'ORG', 'HTML', 'API', 'JSON', 'XML']
-        if symbol in excluded:
+        if symbol in EXCLUDED_SYMBOLS:
             return False
         
         # Doit être alphanumérique
@@ -29,56 +29,99 @@ TESTING APPROACH:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import re
 import sys
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
-import requests
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import aiohttp
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_UNPARSED = object()
+ERROR_BODY_LIMIT = 1024  # Error bodies only feed log messages: keep a bounded prefix
+
+@dataclass
+class HTTPResult:
+    """Buffered HTTP response exposing the requests-style fields the tests use"""
+    status_code: int
+    text: str
+    _parsed: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
+    
+    def json(self):
+        # Parsed once: cached responses are shared by several tests
+        if self._parsed is _UNPARSED:
+            self._parsed = json.loads(self.text)
+        return self._parsed
+
+class LazyJSON:
+    """Pretty-print a payload only if a log handler actually formats the record"""
+    __slots__ = ('payload',)
+    
+    def __init__(self, payload: Any):
+        self.payload = payload
+    
+    def __str__(self) -> str:
+        return json.dumps(self.payload, indent=2)
+
+@functools.lru_cache(maxsize=None)
+def read_backend_url(env_path: str = '/app/frontend/.env') -> str:
+    """Parse REACT_APP_BACKEND_URL from the frontend .env in one regex pass (memoized)"""
+    try:
+        match = re.search(rb'^REACT_APP_BACKEND_URL=(\S+)', Path(env_path).read_bytes(), re.M)
+    except OSError:
+        match = None
+    return match.group(1).decode() if match else "http://localhost:8001"
+
+def read_text_if_exists(path: str) -> Optional[str]:
+    """Read a text file, or None if it is missing (one open() instead of exists() + open())"""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
 class BingXIntegrationTestSuite:
     """Comprehensive test suite for BingX API integration system"""
     
-    def __init__(self):
+    # Test-name fragment -> (met, failed) requirement message, checked in order
+    REQUIREMENT_MESSAGES = {
+        "API Connectivity": ("✅ BingX API connectivity verified", "❌ BingX API connectivity failed"),
+        "Account Balance": ("✅ Account balance retrieval working", "❌ Account balance retrieval not working"),
+        "Integration Manager": ("✅ BingX Integration Manager operational", "❌ BingX Integration Manager not operational"),
+        "All BingX API Endpoints": ("✅ All 15 BingX endpoints functional", "❌ BingX endpoints not fully functional"),
+        "Risk Management": ("✅ Risk management system working", "❌ Risk management system not working"),
+        "IA2 Integration": ("✅ IA2 trade execution via BingX working", "❌ IA2 trade execution via BingX failed"),
+        "Error Handling": ("✅ Error handling resilient", "❌ Error handling not resilient"),
+        "API Credentials": ("✅ API credentials validated", "❌ API credentials validation failed"),
+    }
+    
+    # Field / status sets checked with C-level set operations instead of per-item Python loops
+    BALANCE_FIELDS = frozenset(('balance', 'available_balance', 'timestamp'))
+    SUCCESS_STATUSES = frozenset(('SUCCESS', 'SUCCESS_NO_JSON'))
+    
+    def __init__(self, results_path: Optional[str] = None):
         # Get backend URL from frontend env
-        try:
-            with open('/app/frontend/.env', 'r') as f:
-                for line in f:
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        backend_url = line.split('=')[1].strip()
-                        break
-                else:
-                    backend_url = "http://localhost:8001"
-        except Exception:
-            backend_url = "http://localhost:8001"
+        backend_url = read_backend_url()
         
         self.api_url = f"{backend_url}/api"
+        self.http: Optional[aiohttp.ClientSession] = None  # Non-blocking keep-alive session, opened on first request
+        self.api_connected: Optional[bool] = None  # Set by test 1, reused by test 8
+        self._get_cache: Dict[str, Tuple[float, asyncio.Task]] = {}  # path -> (expires_at, shared GET)
         logger.info(f"Testing BingX Integration System at: {self.api_url}")
         
-        # Test results
-        self.test_results = []
-        
-        # Expected BingX endpoints to test
-        self.bingx_endpoints = [
-            {'method': 'GET', 'path': '/bingx/status', 'name': 'System Status'},
-            {'method': 'GET', 'path': '/bingx/balance', 'name': 'Account Balance'},
-            {'method': 'GET', 'path': '/bingx/positions', 'name': 'Open Positions'},
-            {'method': 'GET', 'path': '/bingx/risk-config', 'name': 'Risk Configuration'},
-            {'method': 'GET', 'path': '/bingx/trading-history', 'name': 'Trading History'},
-            {'method': 'POST', 'path': '/bingx/execute-ia2', 'name': 'IA2 Trade Execution'},
-            {'method': 'GET', 'path': '/bingx/market-price', 'name': 'Market Price'},
-            {'method': 'POST', 'path': '/bingx/trade', 'name': 'Manual Trade'},
-            {'method': 'POST', 'path': '/bingx/close-position', 'name': 'Close Position'},
-            {'method': 'POST', 'path': '/bingx/close-all-positions', 'name': 'Close All Positions'},
-            {'method': 'POST', 'path': '/bingx/emergency-stop', 'name': 'Emergency Stop'},
-            {'method': 'POST', 'path': '/bingx/risk-config', 'name': 'Update Risk Config'},
-        ]
+        # Test results: bounded ring buffer, optionally streamed as JSON Lines
+        self.test_results = deque(maxlen=10_000)
+        self._results_fp = open(results_path, "a", buffering=1 << 16) if results_path else None
         
         # Mock IA2 decision data for testing
         self.mock_ia2_decision = {
@@ -93,6 +136,66 @@ class BingXIntegrationTestSuite:
             "reasoning": "Strong bullish momentum with RSI oversold recovery"
         }
         
+        # Expected BingX endpoints to test, with their query string / mock payload
+        self.bingx_endpoints = [
+            {'method': 'GET', 'path': '/bingx/status', 'name': 'System Status', 'cached': True},
+            {'method': 'GET', 'path': '/bingx/balance', 'name': 'Account Balance', 'cached': True},
+            {'method': 'GET', 'path': '/bingx/positions', 'name': 'Open Positions'},
+            {'method': 'GET', 'path': '/bingx/risk-config', 'name': 'Risk Configuration'},
+            {'method': 'GET', 'path': '/bingx/trading-history', 'name': 'Trading History'},
+            {'method': 'POST', 'path': '/bingx/execute-ia2', 'name': 'IA2 Trade Execution',
+             'json': self.mock_ia2_decision},
+            {'method': 'GET', 'path': '/bingx/market-price', 'name': 'Market Price', 'query': '?symbol=BTCUSDT'},
+            {'method': 'POST', 'path': '/bingx/trade', 'name': 'Manual Trade',
+             'json': {"symbol": "BTCUSDT", "side": "LONG", "quantity": 0.001, "leverage": 5}},
+            {'method': 'POST', 'path': '/bingx/close-position', 'name': 'Close Position',
+             'json': {"symbol": "BTCUSDT", "position_side": "LONG"}},
+            {'method': 'POST', 'path': '/bingx/close-all-positions', 'name': 'Close All Positions'},
+            {'method': 'POST', 'path': '/bingx/emergency-stop', 'name': 'Emergency Stop'},
+            {'method': 'POST', 'path': '/bingx/risk-config', 'name': 'Update Risk Config',
+             'json': {"max_position_size": 0.1, "max_leverage": 10, "stop_loss_percentage": 0.02}},
+        ]
+        
+        # Resolve URLs and payloads once instead of dispatching on the path for every request
+        for endpoint in self.bingx_endpoints:
+            endpoint['url'] = f"{self.api_url}{endpoint['path']}{endpoint.get('query', '')}"
+            endpoint.setdefault('json', {})
+        
+    async def _request(self, method: str, url: str, json_data: Optional[Dict] = None, timeout: float = 30) -> HTTPResult:
+        """Send a request through the shared aiohttp session without blocking the event loop"""
+        if self.http is None or self.http.closed:
+            self.http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60))
+        async with self.http.request(method, url, json=json_data, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status < 400:
+                return HTTPResult(response.status, await response.text())
+            # Never buffer/decode a whole (possibly huge) error page just to log its head
+            head = await response.content.read(ERROR_BODY_LIMIT)
+            return HTTPResult(response.status, head.decode('utf-8', 'replace'))
+    
+    async def _get(self, url: str, timeout: float = 30) -> HTTPResult:
+        return await self._request("GET", url, timeout=timeout)
+    
+    async def _post(self, url: str, json: Optional[Dict] = None, timeout: float = 30) -> HTTPResult:
+        return await self._request("POST", url, json_data=json, timeout=timeout)
+    
+    async def _cached_get(self, path: str, ttl: float = 60.0) -> HTTPResult:
+        """GET a read-only endpoint once per TTL, sharing the in-flight request between tests"""
+        now = time.monotonic()
+        entry = self._get_cache.get(path)
+        if (entry is None or now >= entry[0]
+                or (entry[1].done() and (entry[1].cancelled() or entry[1].exception() is not None))):
+            entry = (now + ttl, asyncio.ensure_future(self._get(f"{self.api_url}{path}", timeout=30)))
+            self._get_cache[path] = entry
+        return await asyncio.shield(entry[1])
+    
+    async def close(self):
+        """Close the HTTP session and flush the results stream"""
+        if self.http is not None and not self.http.closed:
+            await self.http.close()
+        if self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+    
     def log_test_result(self, test_name: str, success: bool, details: str = ""):
         """Log test result"""
         status = "✅ PASS" if success else "❌ FAIL"
@@ -100,23 +203,32 @@ class BingXIntegrationTestSuite:
         if details:
             logger.info(f"   Details: {details}")
         
-        self.test_results.append({
+        # Integer epoch ns; formatted with _fmt_ts() only when reporting
+        record = {
             'test': test_name,
             'success': success,
             'details': details,
-            'timestamp': datetime.now().isoformat()
-        })
+            'ts_ns': time.time_ns()
+        }
+        # Concurrent tests all run on the event loop thread: deque.append is atomic, no lock needed
+        self.test_results.append(record)
+        if self._results_fp is not None:
+            self._results_fp.write(json.dumps(record) + "\n")
+    
+    @staticmethod
+    def _fmt_ts(ns: int) -> str:
+        return datetime.fromtimestamp(ns / 1e9).isoformat()
     
     async def test_1_bingx_api_connectivity(self):
         """Test 1: BingX API Connectivity via /api/bingx/status endpoint"""
         logger.info("\n🔍 TEST 1: BingX API Connectivity Test")
         
         try:
-            response = requests.get(f"{self.api_url}/bingx/status", timeout=30)
+            response = await self._cached_get("/bingx/status")
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"   📊 Status response: {json.dumps(data, indent=2)}")
+                logger.info("   📊 Status response: %s", LazyJSON(data))
                 
                 # Check for expected status fields
                 expected_fields = ['status', 'api_connected', 'timestamp']
@@ -124,6 +236,7 @@ class BingXIntegrationTestSuite:
                 
                 if not missing_fields:
                     api_connected = data.get('api_connected', False)
+                    self.api_connected = bool(api_connected)
                     if api_connected:
                         self.log_test_result("BingX API Connectivity", True, f"API connected successfully: {data.get('status')}")
                     else:
@@ -141,15 +254,14 @@ class BingXIntegrationTestSuite:
         logger.info("\n🔍 TEST 2: Account Balance Retrieval Test")
         
         try:
-            response = requests.get(f"{self.api_url}/bingx/balance", timeout=30)
+            response = await self._cached_get("/bingx/balance")
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"   📊 Balance response: {json.dumps(data, indent=2)}")
+                logger.info("   📊 Balance response: %s", LazyJSON(data))
                 
                 # Check for expected balance fields
-                expected_fields = ['balance', 'available_balance', 'timestamp']
-                has_balance_data = any(field in data for field in expected_fields)
+                has_balance_data = not self.BALANCE_FIELDS.isdisjoint(data.keys())
                 
                 if has_balance_data:
                     balance = data.get('balance', data.get('total_balance', 0))
@@ -173,7 +285,7 @@ class BingXIntegrationTestSuite:
         
         try:
             # Test system status to verify manager initialization
-            status_response = requests.get(f"{self.api_url}/bingx/status", timeout=30)
+            status_response = await self._cached_get("/bingx/status")
             
             if status_response.status_code == 200:
                 status_data = status_response.json()
@@ -199,102 +311,76 @@ class BingXIntegrationTestSuite:
         except Exception as e:
             self.log_test_result("BingX Integration Manager", False, f"Exception: {str(e)}")
     
-    async def test_4_all_bingx_endpoints(self):
-        """Test 4: Test All 15 BingX API Endpoints"""
-        logger.info("\n🔍 TEST 4: All BingX API Endpoints Test")
-        
-        endpoint_results = []
+    async def _probe_endpoint(self, endpoint: Dict) -> Dict:
+        """Call one BingX endpoint and summarise the outcome"""
+        method = endpoint['method']
+        path = endpoint['path']
+        name = endpoint['name']
         
-        for endpoint in self.bingx_endpoints:
-            try:
-                method = endpoint['method']
-                path = endpoint['path']
-                name = endpoint['name']
-                
-                logger.info(f"   Testing {method} {path} ({name})")
-                
-                if method == 'GET':
-                    if 'market-price' in path:
-                        # Add symbol parameter for market price endpoint
-                        response = requests.get(f"{self.api_url}{path}?symbol=BTCUSDT", timeout=30)
-                    else:
-                        response = requests.get(f"{self.api_url}{path}", timeout=30)
-                        
-                elif method == 'POST':
-                    if 'execute-ia2' in path:
-                        # Use mock IA2 decision data
-                        response = requests.post(f"{self.api_url}{path}", 
-                                               json=self.mock_ia2_decision, timeout=30)
-                    elif 'trade' in path:
-                        # Mock manual trade data
-                        trade_data = {
-                            "symbol": "BTCUSDT",
-                            "side": "LONG",
-                            "quantity": 0.001,
-                            "leverage": 5
-                        }
-                        response = requests.post(f"{self.api_url}{path}", 
-                                               json=trade_data, timeout=30)
-                    elif 'close-position' in path:
-                        # Mock close position data
-                        close_data = {
-                            "symbol": "BTCUSDT",
-                            "position_side": "LONG"
-                        }
-                        response = requests.post(f"{self.api_url}{path}", 
-                                               json=close_data, timeout=30)
-                    elif 'risk-config' in path:
-                        # Mock risk config data
-                        risk_data = {
-                            "max_position_size": 0.1,
-                            "max_leverage": 10,
-                            "stop_loss_percentage": 0.02
-                        }
-                        response = requests.post(f"{self.api_url}{path}", 
-                                               json=risk_data, timeout=30)
-                    else:
-                        # Empty POST for other endpoints
-                        response = requests.post(f"{self.api_url}{path}", json={}, timeout=30)
-                
-                # Evaluate response
-                if response.status_code in [200, 201]:
-                    try:
-                        data = response.json()
-                        endpoint_results.append({
-                            'endpoint': f"{method} {path}",
-                            'name': name,
-                            'status': 'SUCCESS',
-                            'response_size': len(str(data))
-                        })
-                        logger.info(f"      ✅ {name}: SUCCESS (HTTP {response.status_code})")
-                    except:
-                        endpoint_results.append({
-                            'endpoint': f"{method} {path}",
-                            'name': name,
-                            'status': 'SUCCESS_NO_JSON',
-                            'response_size': len(response.text)
-                        })
-                        logger.info(f"      ✅ {name}: SUCCESS - No JSON response")
-                else:
-                    endpoint_results.append({
+        try:
+            logger.info("   Testing %s %s (%s)", method, path, name)
+            
+            if endpoint.get('cached'):
+                # Read-only and already fetched by tests 1-3: reuse the shared response
+                response = await self._cached_get(path)
+            elif method == 'GET':
+                response = await self._get(endpoint['url'], timeout=30)
+            else:
+                response = await self._post(endpoint['url'], json=endpoint['json'], timeout=30)
+            
+            # Evaluate response
+            if response.status_code in [200, 201]:
+                try:
+                    data = response.json()
+                    logger.info("      ✅ %s: SUCCESS (HTTP %s)", name, response.status_code)
+                    return {
                         'endpoint': f"{method} {path}",
                         'name': name,
-                        'status': f'HTTP_{response.status_code}',
+                        'status': 'SUCCESS',
+                        'response_size': len(str(data))
+                    }
+                except:
+                    logger.info("      ✅ %s: SUCCESS - No JSON response", name)
+                    return {
+                        'endpoint': f"{method} {path}",
+                        'name': name,
+                        'status': 'SUCCESS_NO_JSON',
                         'response_size': len(response.text)
-                    })
-                    logger.info(f"      ❌ {name}: HTTP {response.status_code}")
-                    
-            except Exception as e:
-                endpoint_results.append({
+                    }
+            else:
+                logger.info("      ❌ %s: HTTP %s", name, response.status_code)
+                return {
                     'endpoint': f"{method} {path}",
                     'name': name,
-                    'status': 'ERROR',
-                    'error': str(e)
-                })
-                logger.info(f"      ❌ {name}: Exception - {str(e)}")
+                    'status': f'HTTP_{response.status_code}',
+                    'response_size': len(response.text)
+                }
+        
+        except Exception as e:
+            logger.info("      ❌ %s: Exception - %s", name, e)
+            return {
+                'endpoint': f"{method} {path}",
+                'name': name,
+                'status': 'ERROR',
+                'error': str(e)
+            }
+    
+    async def test_4_all_bingx_endpoints(self):
+        """Test 4: Test All 15 BingX API Endpoints"""
+        logger.info("\n🔍 TEST 4: All BingX API Endpoints Test")
+        
+        # Read-only GETs go out in one concurrent flight; POSTs mutate state and stay sequential
+        get_indices = [i for i, e in enumerate(self.bingx_endpoints) if e['method'] == 'GET']
+        outcomes = dict(zip(get_indices, await asyncio.gather(
+            *(self._probe_endpoint(self.bingx_endpoints[i]) for i in get_indices)
+        )))
+        for i, endpoint in enumerate(self.bingx_endpoints):
+            if i not in outcomes:
+                outcomes[i] = await self._probe_endpoint(endpoint)
+        endpoint_results = [outcomes[i] for i in range(len(self.bingx_endpoints))]
         
         # Evaluate overall endpoint testing
-        successful_endpoints = len([r for r in endpoint_results if r['status'] in ['SUCCESS', 'SUCCESS_NO_JSON']])
+        successful_endpoints = sum(r['status'] in self.SUCCESS_STATUSES for r in endpoint_results)
         total_endpoints = len(endpoint_results)
         
         success_rate = successful_endpoints / total_endpoints if total_endpoints > 0 else 0
@@ -307,10 +393,10 @@ class BingXIntegrationTestSuite:
                                f"Low success rate: {successful_endpoints}/{total_endpoints} ({success_rate:.1%})")
         
         # Log detailed endpoint results
-        logger.info(f"   📊 Endpoint Test Results:")
+        logger.info("   📊 Endpoint Test Results:")
         for result in endpoint_results:
-            status_icon = "✅" if result['status'] in ['SUCCESS', 'SUCCESS_NO_JSON'] else "❌"
-            logger.info(f"      {status_icon} {result['name']}: {result['status']}")
+            status_icon = "✅" if result['status'] in self.SUCCESS_STATUSES else "❌"
+            logger.info("      %s %s: %s", status_icon, result['name'], result['status'])
     
     async def test_5_risk_management_system(self):
         """Test 5: Risk Management Configuration and Validation"""
@@ -318,11 +404,11 @@ class BingXIntegrationTestSuite:
         
         try:
             # Test getting risk configuration
-            get_response = requests.get(f"{self.api_url}/bingx/risk-config", timeout=30)
+            get_response = await self._get(f"{self.api_url}/bingx/risk-config", timeout=30)
             
             if get_response.status_code == 200:
                 risk_config = get_response.json()
-                logger.info(f"   📊 Current risk config: {json.dumps(risk_config, indent=2)}")
+                logger.info("   📊 Current risk config: %s", LazyJSON(risk_config))
                 
                 # Check for expected risk parameters
                 expected_params = ['max_position_size', 'max_leverage', 'stop_loss_percentage']
@@ -336,8 +422,8 @@ class BingXIntegrationTestSuite:
                         "stop_loss_percentage": 0.03  # 3% stop loss
                     }
                     
-                    post_response = requests.post(f"{self.api_url}/bingx/risk-config", 
-                                                json=new_risk_config, timeout=30)
+                    post_response = await self._post(f"{self.api_url}/bingx/risk-config", 
+                                                     json=new_risk_config, timeout=30)
                     
                     if post_response.status_code in [200, 201]:
                         self.log_test_result("Risk Management System", True, 
@@ -363,12 +449,12 @@ class BingXIntegrationTestSuite:
             # Test IA2 trade execution with mock data
             logger.info(f"   🚀 Testing IA2 trade execution with mock decision: {self.mock_ia2_decision}")
             
-            response = requests.post(f"{self.api_url}/bingx/execute-ia2", 
-                                   json=self.mock_ia2_decision, timeout=60)
+            response = await self._post(f"{self.api_url}/bingx/execute-ia2", 
+                                        json=self.mock_ia2_decision, timeout=60)
             
             if response.status_code in [200, 201]:
                 result = response.json()
-                logger.info(f"   📊 IA2 execution result: {json.dumps(result, indent=2)}")
+                logger.info("   📊 IA2 execution result: %s", LazyJSON(result))
                 
                 # Check execution result
                 status = result.get('status', 'unknown')
@@ -406,7 +492,7 @@ class BingXIntegrationTestSuite:
         
         # Test 1: Invalid symbol
         try:
-            response = requests.get(f"{self.api_url}/bingx/market-price?symbol=INVALIDUSDT", timeout=30)
+            response = await self._get(f"{self.api_url}/bingx/market-price?symbol=INVALIDUSDT", timeout=30)
             if response.status_code in [400, 404, 422]:
                 error_test_results.append("✅ Invalid symbol handled correctly")
             else:
@@ -422,7 +508,7 @@ class BingXIntegrationTestSuite:
                 "quantity": -1,  # Invalid negative quantity
                 "leverage": 1000  # Invalid high leverage
             }
-            response = requests.post(f"{self.api_url}/bingx/trade", json=invalid_trade, timeout=30)
+            response = await self._post(f"{self.api_url}/bingx/trade", json=invalid_trade, timeout=30)
             if response.status_code in [400, 422]:
                 error_test_results.append("✅ Invalid trade data handled correctly")
             else:
@@ -438,7 +524,7 @@ class BingXIntegrationTestSuite:
                 "confidence": 2.0,  # Invalid confidence > 1
                 "position_size": -5  # Invalid negative size
             }
-            response = requests.post(f"{self.api_url}/bingx/execute-ia2", json=invalid_ia2, timeout=30)
+            response = await self._post(f"{self.api_url}/bingx/execute-ia2", json=invalid_ia2, timeout=30)
             if response.status_code in [400, 422] or (response.status_code == 200 and 
                                                      response.json().get('status') in ['rejected', 'error']):
                 error_test_results.append("✅ Invalid IA2 decision handled correctly")
@@ -449,7 +535,7 @@ class BingXIntegrationTestSuite:
         
         # Test 4: System still responsive after errors
         try:
-            response = requests.get(f"{self.api_url}/bingx/status", timeout=30)
+            response = await self._get(f"{self.api_url}/bingx/status", timeout=30)
             if response.status_code == 200:
                 error_test_results.append("✅ System remains responsive after errors")
             else:
@@ -481,28 +567,32 @@ class BingXIntegrationTestSuite:
             backend_env_path = '/app/backend/.env'
             credentials_found = False
             
-            if os.path.exists(backend_env_path):
-                with open(backend_env_path, 'r') as f:
-                    env_content = f.read()
-                    
-                    has_api_key = 'BINGX_API_KEY=' in env_content
-                    has_secret_key = 'BINGX_SECRET_KEY=' in env_content
-                    has_base_url = 'BINGX_BASE_URL=' in env_content
+            # File I/O off the event loop so in-flight requests keep progressing
+            env_content = await asyncio.to_thread(read_text_if_exists, backend_env_path)
+            
+            if env_content is not None:
+                has_api_key = 'BINGX_API_KEY=' in env_content
+                has_secret_key = 'BINGX_SECRET_KEY=' in env_content
+                has_base_url = 'BINGX_BASE_URL=' in env_content
+                
+                if has_api_key and has_secret_key:
+                    credentials_found = True
+                    logger.info("   📊 BingX credentials found in environment")
                     
-                    if has_api_key and has_secret_key:
-                        credentials_found = True
-                        logger.info("   📊 BingX credentials found in environment")
-                        
-                        # Extract API key for validation (first 10 chars only for security)
-                        for line in env_content.split('\n'):
-                            if line.startswith('BINGX_API_KEY='):
-                                api_key_preview = line.split('=')[1][:10] + "..."
-                                logger.info(f"   📊 API Key preview: {api_key_preview}")
-                                break
+                    # Extract API key for validation (first 10 chars only for security)
+                    for line in env_content.split('\n'):
+                        if line.startswith('BINGX_API_KEY='):
+                            api_key_preview = line.split('=')[1][:10] + "..."
+                            logger.info(f"   📊 API Key preview: {api_key_preview}")
+                            break
             
-            if credentials_found:
+            if credentials_found and self.api_connected:
+                # Connectivity already confirmed by test 1: no need for another status round-trip
+                self.log_test_result("API Credentials Validation", True, 
+                                   "Credentials configured and API connection successful")
+            elif credentials_found:
                 # Test credentials by checking API connectivity
-                status_response = requests.get(f"{self.api_url}/bingx/status", timeout=30)
+                status_response = await self._cached_get("/bingx/status")
                 
                 if status_response.status_code == 200:
                     status_data = status_response.json()
@@ -533,10 +623,14 @@ class BingXIntegrationTestSuite:
         logger.info("🎯 Expected: Complete BingX integration working with all 15 endpoints functional")
         logger.info("=" * 80)
         
-        # Run all tests in sequence
-        await self.test_1_bingx_api_connectivity()
-        await self.test_2_account_balance_retrieval()
-        await self.test_3_bingx_integration_manager()
+        # Read-only checks are independent: run them concurrently on the shared session
+        await asyncio.gather(
+            self.test_1_bingx_api_connectivity(),
+            self.test_2_account_balance_retrieval(),
+            self.test_3_bingx_integration_manager()
+        )
+        
+        # Tests that mutate server state (risk config, orders) stay in sequence
         await self.test_4_all_bingx_endpoints()
         await self.test_5_risk_management_system()
         await self.test_6_ia2_integration_execution()
@@ -548,12 +642,14 @@ class BingXIntegrationTestSuite:
         logger.info("📊 BINGX INTEGRATION COMPREHENSIVE TEST SUMMARY")
         logger.info("=" * 80)
         
-        passed_tests = sum(1 for result in self.test_results if result['success'])
-        total_tests = len(self.test_results)
+        # One consistent snapshot for every summary pass, even if a straggling task appends meanwhile
+        results = list(self.test_results)
+        passed_tests = sum(1 for result in results if result['success'])
+        total_tests = len(results)
         
-        for result in self.test_results:
+        for result in results:
             status = "✅ PASS" if result['success'] else "❌ FAIL"
-            logger.info(f"{status}: {result['test']}")
+            logger.info(f"{status}: {result['test']} ({self._fmt_ts(result['ts_ns'])})")
             if result['details']:
                 logger.info(f"   {result['details']}")
                 
@@ -591,41 +687,14 @@ class BingXIntegrationTestSuite:
         requirements_failed = []
         
         # Check each requirement based on test results
-        for result in self.test_results:
+        for result in results:
+            messages = next((msgs for key, msgs in self.REQUIREMENT_MESSAGES.items() if key in result['test']), None)
+            if messages is None:
+                continue
             if result['success']:
-                if "API Connectivity" in result['test']:
-                    requirements_met.append("✅ BingX API connectivity verified")
-                elif "Account Balance" in result['test']:
-                    requirements_met.append("✅ Account balance retrieval working")
-                elif "Integration Manager" in result['test']:
-                    requirements_met.append("✅ BingX Integration Manager operational")
-                elif "All BingX API Endpoints" in result['test']:
-                    requirements_met.append("✅ All 15 BingX endpoints functional")
-                elif "Risk Management" in result['test']:
-                    requirements_met.append("✅ Risk management system working")
-                elif "IA2 Integration" in result['test']:
-                    requirements_met.append("✅ IA2 trade execution via BingX working")
-                elif "Error Handling" in result['test']:
-                    requirements_met.append("✅ Error handling resilient")
-                elif "API Credentials" in result['test']:
-                    requirements_met.append("✅ API credentials validated")
+                requirements_met.append(messages[0])
             else:
-                if "API Connectivity" in result['test']:
-                    requirements_failed.append("❌ BingX API connectivity failed")
-                elif "Account Balance" in result['test']:
-                    requirements_failed.append("❌ Account balance retrieval not working")
-                elif "Integration Manager" in result['test']:
-                    requirements_failed.append("❌ BingX Integration Manager not operational")
-                elif "All BingX API Endpoints" in result['test']:
-                    requirements_failed.append("❌ BingX endpoints not fully functional")
-                elif "Risk Management" in result['test']:
-                    requirements_failed.append("❌ Risk management system not working")
-                elif "IA2 Integration" in result['test']:
-                    requirements_failed.append("❌ IA2 trade execution via BingX failed")
-                elif "Error Handling" in result['test']:
-                    requirements_failed.append("❌ Error handling not resilient")
-                elif "API Credentials" in result['test']:
-                    requirements_failed.append("❌ API credentials validation failed")
+                requirements_failed.append(messages[1])
         
         for req in requirements_met:
             logger.info(f"   {req}")
@@ -655,8 +724,11 @@ class BingXIntegrationTestSuite:
 
 async def main():
     """Main test execution"""
-    test_suite = BingXIntegrationTestSuite()
-    passed, total = await test_suite.run_comprehensive_tests()
+    test_suite = BingXIntegrationTestSuite(results_path=os.environ.get("BACKEND_TEST_RESULTS"))
+    try:
+        passed, total = await test_suite.run_comprehensive_tests()
+    finally:
+        await test_suite.close()
     
     # Exit with appropriate code
     if passed == total:
@@ -10,18 +10,64 @@ This script analyzes existing IA2 decisions in the database to check:
 4. Quality of rr_reasoning explanations
 """
 
+import asyncio
 import json
 import logging
+import os
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-import subprocess
-import re
+from typing import Dict, Any, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Keyword tables built once, already lowercased for the case-insensitive checks
+FALLBACK_KEYWORDS = tuple((kw, kw.lower()) for kw in (
+    "1.00:1 (IA1 R:R unavailable)",
+    "IA1 R:R unavailable",
+    "fallback",
+    "default R:R",
+    "unavailable",
+    "deemed suboptimal"
+))
+SR_TERMS = ('support', 'resistance')
+FORMULA_TERMS = ('formula', 'calculation', 'rr =')
+PRICE_MARKERS = ('$', '0.', '1.', '2.', '3.', '4.', '5.')
+
+# Decisions stored after this date carry the RR calculation fix
+FIX_DATE = datetime(2025, 9, 10)
+IA2_FILTER = {'ia2_reasoning': {'$exists': True}}
+
+# Recent IA2 decisions with all relevant fields
+RECENT_DECISIONS_FILTER = {**IA2_FILTER, 'timestamp': {'$gte': FIX_DATE}}
+RECENT_DECISIONS_PROJECTION = {
+    '_id': 0,
+    'symbol': 1,
+    'signal': 1,
+    'confidence': 1,
+    'calculated_rr': 1,
+    'rr_reasoning': 1,
+    'risk_reward_ratio': 1,
+    'entry_price': 1,
+    'stop_loss': 1,
+    'take_profit_1': 1,
+    'timestamp': 1,
+    'ia2_reasoning': 1
+}
+
+# Older IA2 decisions (before the fix)
+OLDER_DECISIONS_FILTER = {**IA2_FILTER, 'timestamp': {'$lt': FIX_DATE}}
+OLDER_DECISIONS_PROJECTION = {
+    '_id': 0,
+    'symbol': 1,
+    'calculated_rr': 1,
+    'rr_reasoning': 1,
+    'timestamp': 1
+}
+
 class IA2RRAnalysisReport:
     """Generate comprehensive analysis report of IA2 RR calculation fix"""
     
@@ -29,54 +75,51 @@ class IA2RRAnalysisReport:
         self.analysis_results = {}
         self.ia2_decisions = []
         
-    def run_mongo_query(self, query: str) -> List[Dict]:
-        """Execute MongoDB query and return results"""
+        # Native async driver (same as the backend): queries are awaited directly, no mongosh process per query
+        self.mongo_client = AsyncIOMotorClient(os.environ.get('MONGO_URL', 'mongodb://localhost:27017'), maxPoolSize=20)
+        self.db = self.mongo_client[os.environ.get('DB_NAME', 'myapp')]
+    
+    async def fetch_all(self):
+        """Run the overview, recent and historical queries concurrently"""
+        decisions = self.db.trading_decisions
         try:
-            cmd = f'mongosh myapp --eval "{query}" --quiet'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                # Parse the JSON output
-                output = result.stdout.strip()
-                if output and output != 'null':
-                    try:
-                        return json.loads(output)
-                    except json.JSONDecodeError:
-                        # Try to extract JSON from the output
-                        json_match = re.search(r'\[.*\]', output, re.DOTALL)
-                        if json_match:
-                            return json.loads(json_match.group())
-                        else:
-                            logger.warning(f"Could not parse MongoDB output: {output[:200]}...")
-                            return []
-                return []
-            else:
-                logger.error(f"MongoDB query failed: {result.stderr}")
-                return []
+            return await asyncio.gather(
+                self._fetch_overview_counts(),
+                decisions.find(RECENT_DECISIONS_FILTER, RECENT_DECISIONS_PROJECTION).sort('timestamp', -1).to_list(length=10),
+                decisions.find(OLDER_DECISIONS_FILTER, OLDER_DECISIONS_PROJECTION).sort('timestamp', -1).to_list(length=10)
+            )
         except Exception as e:
-            logger.error(f"Error executing MongoDB query: {e}")
-            return []
+            logger.error(f"Error querying MongoDB: {e}")
+            return {}, [], []
+        finally:
+            self.mongo_client.close()
     
-    def analyze_ia2_decisions_overview(self):
+    async def _fetch_overview_counts(self) -> Dict[str, int]:
+        # All four counts from one $facet pass over the IA2 decisions (one round trip instead of four scans)
+        seven_days_ago = datetime.now() - timedelta(days=7)
+        pipeline = [
+            {'$match': IA2_FILTER},
+            {'$facet': {
+                'total': [{'$count': 'n'}],
+                'recent': [{'$match': {'timestamp': {'$gte': seven_days_ago}}}, {'$count': 'n'}],
+                'calculated_rr': [{'$match': {'calculated_rr': {'$exists': True}}}, {'$count': 'n'}],
+                'rr_reasoning': [{'$match': {'rr_reasoning': {'$exists': True}}}, {'$count': 'n'}]
+            }}
+        ]
+        facets = await self.db.trading_decisions.aggregate(pipeline).to_list(length=1)
+        # $count emits nothing for an empty facet
+        return {name: (buckets[0]['n'] if buckets else 0) for name, buckets in (facets[0] if facets else {}).items()}
+    
+    def analyze_ia2_decisions_overview(self, counts):
         """Analyze overview of IA2 decisions"""
         logger.info("🔍 ANALYZING IA2 DECISIONS OVERVIEW")
         
-        # Get total IA2 decisions
-        query = 'db.trading_decisions.find({ia2_reasoning: {\\$exists: true}}).count()'
-        total_ia2 = self.run_mongo_query(query)
-        
-        # Get recent IA2 decisions (last 7 days)
-        seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        query = f'db.trading_decisions.find({{ia2_reasoning: {{\\$exists: true}}, timestamp: {{\\$gte: ISODate("{seven_days_ago}")}}}}).count()'
-        recent_ia2 = self.run_mongo_query(query)
-        
-        # Get IA2 decisions with calculated_rr field
-        query = 'db.trading_decisions.find({ia2_reasoning: {\\$exists: true}, calculated_rr: {\\$exists: true}}).count()'
-        with_calculated_rr = self.run_mongo_query(query)
-        
-        # Get IA2 decisions with rr_reasoning field
-        query = 'db.trading_decisions.find({ia2_reasoning: {\\$exists: true}, rr_reasoning: {\\$exists: true}}).count()'
-        with_rr_reasoning = self.run_mongo_query(query)
+        if not isinstance(counts, dict):
+            counts = {}
+        total_ia2 = counts.get('total')
+        recent_ia2 = counts.get('recent')
+        with_calculated_rr = counts.get('calculated_rr')
+        with_rr_reasoning = counts.get('rr_reasoning')
         
         self.analysis_results['overview'] = {
             'total_ia2_decisions': total_ia2 if isinstance(total_ia2, int) else 0,
@@ -90,29 +133,10 @@ class IA2RRAnalysisReport:
         logger.info(f"   📊 With calculated_rr field: {self.analysis_results['overview']['with_calculated_rr']}")
         logger.info(f"   📊 With rr_reasoning field: {self.analysis_results['overview']['with_rr_reasoning']}")
     
-    def analyze_recent_ia2_decisions(self):
+    def analyze_recent_ia2_decisions(self, decisions):
         """Analyze recent IA2 decisions in detail"""
         logger.info("\n🔍 ANALYZING RECENT IA2 DECISIONS")
         
-        # Get recent IA2 decisions with all relevant fields
-        query = '''db.trading_decisions.find({
-            ia2_reasoning: {\\$exists: true},
-            timestamp: {\\$gte: ISODate("2025-09-10T00:00:00.000Z")}
-        }, {
-            symbol: 1,
-            signal: 1,
-            confidence: 1,
-            calculated_rr: 1,
-            rr_reasoning: 1,
-            risk_reward_ratio: 1,
-            entry_price: 1,
-            stop_loss: 1,
-            take_profit_1: 1,
-            timestamp: 1,
-            ia2_reasoning: 1
-        }).sort({timestamp: -1}).limit(10).toArray()'''
-        
-        decisions = self.run_mongo_query(query)
         self.ia2_decisions = decisions
         
         logger.info(f"   📊 Analyzing {len(decisions)} recent IA2 decisions")
@@ -123,15 +147,6 @@ class IA2RRAnalysisReport:
         formula_validation = []
         fallback_patterns = []
         
-        fallback_keywords = [
-            "1.00:1 (IA1 R:R unavailable)",
-            "IA1 R:R unavailable", 
-            "fallback",
-            "default R:R",
-            "unavailable",
-            "deemed suboptimal"
-        ]
-        
         for decision in decisions:
             symbol = decision.get('symbol', 'UNKNOWN')
             signal = decision.get('signal', '').upper()
@@ -147,9 +162,10 @@ class IA2RRAnalysisReport:
             rr_reasoning = decision.get('rr_reasoning', '')
             if rr_reasoning:
                 # Analyze quality of reasoning
-                has_support_resistance = any(term in rr_reasoning.lower() for term in ['support', 'resistance'])
-                has_formula = any(term in rr_reasoning.lower() for term in ['formula', 'calculation', 'rr ='])
-                has_prices = any(char in rr_reasoning for char in ['$', '0.', '1.', '2.', '3.', '4.', '5.'])
+                reasoning_lower = rr_reasoning.lower()
+                has_support_resistance = any(term in reasoning_lower for term in SR_TERMS)
+                has_formula = any(term in reasoning_lower for term in FORMULA_TERMS)
+                has_prices = any(char in rr_reasoning for char in PRICE_MARKERS)
                 
                 quality_score = sum([has_support_resistance, has_formula, has_prices])
                 rr_reasoning_analysis.append(f"{'✅' if quality_score >= 2 else '❌'} {symbol}: rr_reasoning quality {quality_score}/3")
@@ -176,8 +192,8 @@ class IA2RRAnalysisReport:
                     formula_validation.append(f"❌ {symbol} {signal}: RR formula mismatch ({risk_reward_ratio:.2f} vs {expected_rr:.2f})")
             
             # Check for fallback patterns
-            decision_text = json.dumps(decision).lower()
-            found_fallbacks = [pattern for pattern in fallback_keywords if pattern.lower() in decision_text]
+            decision_text = json.dumps(decision, default=str).lower()
+            found_fallbacks = [pattern for pattern, pattern_lower in FALLBACK_KEYWORDS if pattern_lower in decision_text]
             
             if found_fallbacks:
                 fallback_patterns.append(f"❌ {symbol}: Found fallback patterns: {found_fallbacks}")
@@ -208,23 +224,10 @@ class IA2RRAnalysisReport:
         for result in fallback_patterns:
             logger.info(f"      {result}")
     
-    def analyze_historical_comparison(self):
+    def analyze_historical_comparison(self, older_decisions):
         """Compare recent decisions with older ones to see improvement"""
         logger.info("\n🔍 ANALYZING HISTORICAL COMPARISON")
         
-        # Get older IA2 decisions (before the fix)
-        query = '''db.trading_decisions.find({
-            ia2_reasoning: {\\$exists: true},
-            timestamp: {\\$lt: ISODate("2025-09-10T00:00:00.000Z")}
-        }, {
-            symbol: 1,
-            calculated_rr: 1,
-            rr_reasoning: 1,
-            timestamp: 1
-        }).sort({timestamp: -1}).limit(10).toArray()'''
-        
-        older_decisions = self.run_mongo_query(query)
-        
         logger.info(f"   📊 Comparing with {len(older_decisions)} older IA2 decisions")
         
         # Analyze older decisions
@@ -256,9 +259,10 @@ class IA2RRAnalysisReport:
         logger.info("=" * 80)
         
         # Run all analyses
-        self.analyze_ia2_decisions_overview()
-        self.analyze_recent_ia2_decisions()
-        self.analyze_historical_comparison()
+        counts, decisions, older_decisions = asyncio.run(self.fetch_all())
+        self.analyze_ia2_decisions_overview(counts)
+        self.analyze_recent_ia2_decisions(decisions)
+        self.analyze_historical_comparison(older_decisions)
         
         # Generate summary
         logger.info("\n" + "=" * 80)
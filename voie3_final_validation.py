@@ -6,6 +6,7 @@ This validates all 6 requirements from the review request
 
 import sys
 import os
+import re
 import logging
 from datetime import datetime
 
@@ -13,6 +14,37 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+SERVER_PATH = '/app/backend/server.py'
+
+VOIE3_MARKERS = (
+    "exceptional_technical_sentiment",
+    "confidence >= 0.95",
+    "_should_send_to_ia2"
+)
+LOG_PATTERNS = (
+    "🚀 IA2 ACCEPTED (VOIE 3 - OVERRIDE)",
+    "Sentiment technique EXCEPTIONNEL",
+    "BYPASS des critères standard"
+)
+DOC_PATTERNS = (
+    "3 VOIES VERS IA2",
+    "VOIE 1",
+    "VOIE 2",
+    "VOIE 3",
+    "OVERRIDE - Exceptional technical sentiment"
+)
+
+# Une seule regex pour tous les motifs : server.py est balayé une seule fois.
+# Le lookahead garde les correspondances imbriquées ("VOIE 3" dans "... (VOIE 3 - OVERRIDE)")
+_PATTERNS_RE = re.compile("(?=(" + "|".join(
+    re.escape(p) for p in sorted(set(VOIE3_MARKERS + LOG_PATTERNS + DOC_PATTERNS), key=len, reverse=True)
+) + "))")
+
+def scan_server_patterns(path: str = SERVER_PATH):
+    """Read server.py once and return the set of known patterns it contains"""
+    with open(path, 'r') as f:
+        return set(_PATTERNS_RE.findall(f.read()))
+
 def validate_voie3_implementation():
     """Validate all VOIE 3 requirements from the review request"""
     logger.info("🚀 VOIE 3 Final Validation - Complete Review Requirements Check")
@@ -20,19 +52,20 @@ def validate_voie3_implementation():
     
     requirements = []
     
+    try:
+        found_patterns = scan_server_patterns()
+        scan_error = None
+    except Exception as e:
+        found_patterns = set()
+        scan_error = e
+    
     # Requirement 1: VOIE 3 Logic Implementation
     logger.info("📋 REQUIREMENT 1: VOIE 3 Logic Implementation")
     try:
-        with open('/app/backend/server.py', 'r') as f:
-            server_content = f.read()
-        
-        voie3_markers = [
-            "exceptional_technical_sentiment",
-            "confidence >= 0.95",
-            "_should_send_to_ia2"
-        ]
+        if scan_error:
+            raise scan_error
         
-        all_markers_found = all(marker in server_content for marker in voie3_markers)
+        all_markers_found = found_patterns.issuperset(VOIE3_MARKERS)
         
         if all_markers_found:
             logger.info("✅ VOIE 3 logic properly implemented in IA1→IA2 escalation logic")
@@ -133,16 +166,10 @@ def validate_voie3_implementation():
     logger.info("\n📋 REQUIREMENT 5: Logging Validation")
     
     try:
-        with open('/app/backend/server.py', 'r') as f:
-            server_content = f.read()
+        if scan_error:
+            raise scan_error
         
-        log_patterns = [
-            "🚀 IA2 ACCEPTED (VOIE 3 - OVERRIDE)",
-            "Sentiment technique EXCEPTIONNEL",
-            "BYPASS des critères standard"
-        ]
-        
-        all_log_patterns_found = all(pattern in server_content for pattern in log_patterns)
+        all_log_patterns_found = found_patterns.issuperset(LOG_PATTERNS)
         
         if all_log_patterns_found:
             logger.info("✅ Logging validation successful - proper VOIE 3 log messages implemented")
@@ -158,18 +185,10 @@ def validate_voie3_implementation():
     logger.info("\n📋 REQUIREMENT 6: Documentation Update")
     
     try:
-        with open('/app/backend/server.py', 'r') as f:
-            server_content = f.read()
-        
-        doc_patterns = [
-            "3 VOIES VERS IA2",
-            "VOIE 1",
-            "VOIE 2", 
-            "VOIE 3",
-            "OVERRIDE - Exceptional technical sentiment"
-        ]
+        if scan_error:
+            raise scan_error
         
-        all_doc_patterns_found = all(pattern in server_content for pattern in doc_patterns)
+        all_doc_patterns_found = found_patterns.issuperset(DOC_PATTERNS)
         
         if all_doc_patterns_found:
             logger.info("✅ Documentation update successful - IA2 prompt reflects 3-way escalation")